@@ -0,0 +1,25 @@
+"""Console entrypoint for irrev (`irrev`, `python -m irrev`).
+
+Kept free of click so paths that need no argument parsing exit before the
+CLI (and click) is imported.
+"""
+
+import sys
+
+from . import __version__
+
+
+def main() -> None:
+    """Main entrypoint."""
+    # `irrev --version` on its own needs no group parsing or vault lookup.
+    if sys.argv[1:] == ["--version"]:
+        print(f"irrev, version {__version__}")
+        return
+
+    from .cli import cli
+
+    cli()
+
+
+if __name__ == "__main__":
+    main()
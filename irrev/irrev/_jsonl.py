@@ -0,0 +1,42 @@
+"""
+Shared helpers for the append-only JSON Lines logs under .irrev/.
+"""
+
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+from typing import Iterator
+
+
+def iter_lines_reversed(path: Path, end_offset: int | None = None) -> Iterator[bytes]:
+    """Yield the non-blank lines of `path`, last line first, stripped.
+
+    The file is memory-mapped and line boundaries are located with `rfind`,
+    so a caller that stops early only touches the tail pages. Files smaller
+    than one page are read directly. When `end_offset` is given, bytes at or
+    past it are ignored, as if the file ended there. Lines are returned raw;
+    callers parse them into their own record type.
+    """
+    with path.open("rb") as f:
+        size = f.seek(0, 2)
+        if end_offset is not None:
+            size = min(size, end_offset)
+        if size == 0:
+            return
+        if size < mmap.PAGESIZE:
+            f.seek(0)
+            for line in reversed(f.read(size).split(b"\n")):
+                line = line.strip()
+                if line:
+                    yield line
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = size
+            while end > 0:
+                start = mm.rfind(b"\n", 0, end) + 1
+                line = mm[start:end].strip()
+                if line:
+                    yield line
+                end = start - 1
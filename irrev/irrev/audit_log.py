@@ -11,10 +11,29 @@ This module provides:
 """
 
 import json
-from dataclasses import dataclass, field, asdict
+import os
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Iterator
+
+from ._jsonl import iter_lines_reversed
+
+# Shared read-only metadata for entries logged without context.
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
+# Flags for appending one entry. The log is opened per entry, so a rotated or
+# deleted log is recreated rather than written to through a stale descriptor.
+_APPEND_FLAGS = (
+    os.O_WRONLY
+    | os.O_APPEND
+    | os.O_CREAT
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_BINARY", 0)
+)
 
 
 @dataclass
@@ -44,16 +63,34 @@ class AuditEntry:
     operation: str
     erased: ErasureCost
     created: CreationSummary
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAP)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary for JSON serialization.
+
+        Written out field by field rather than via `asdict`, which walks and
+        deep-copies recursively; `details` dicts are shallow-copied.
+        """
+        e = self.erased
+        c = self.created
         return {
             "timestamp": self.timestamp,
             "operation": self.operation,
-            "erased": asdict(self.erased),
-            "created": asdict(self.created),
-            "metadata": self.metadata,
+            "erased": {
+                "notes": e.notes,
+                "edges": e.edges,
+                "files": e.files,
+                "bytes_erased": e.bytes_erased,
+                "details": dict(e.details),
+            },
+            "created": {
+                "notes": c.notes,
+                "edges": c.edges,
+                "files": c.files,
+                "bytes_written": c.bytes_written,
+                "details": dict(c.details),
+            },
+            "metadata": dict(self.metadata),
         }
 
     @classmethod
@@ -64,7 +101,7 @@ class AuditEntry:
             operation=data["operation"],
             erased=ErasureCost(**data.get("erased", {})),
             created=CreationSummary(**data.get("created", {})),
-            metadata=data.get("metadata", {}),
+            metadata=MappingProxyType(data.get("metadata") or {}),
         )
 
 
@@ -81,6 +118,18 @@ def ensure_audit_dir(vault_path: Path) -> Path:
     return log_path
 
 
+def _append_line(vault_path: Path, data: bytes) -> None:
+    """Append `data` to the vault's audit log, retrying short writes."""
+    log_path = ensure_audit_dir(vault_path)
+    fd = os.open(log_path, _APPEND_FLAGS, 0o644)
+    try:
+        rest = memoryview(data)
+        while rest:
+            rest = rest[os.write(fd, rest) :]
+    finally:
+        os.close(fd)
+
+
 def log_operation(
     vault_path: Path,
     operation: str,
@@ -96,7 +145,10 @@ def log_operation(
         operation: Name of the operation (e.g., "neo4j-rebuild", "registry-in-place")
         erased: Summary of what was erased
         created: Summary of what was created
-        metadata: Additional context (e.g., target database, file paths)
+        metadata: Additional context (e.g., target database, file paths).
+            Stored as a read-only view, not copied; a caller may reuse one
+            dict as a template across calls but must not mutate it while
+            the returned entry is still in use.
 
     Returns:
         The created audit entry
@@ -106,44 +158,123 @@ def log_operation(
         operation=operation,
         erased=erased or ErasureCost(),
         created=created or CreationSummary(),
-        metadata=metadata or {},
+        metadata=MappingProxyType(metadata) if metadata else _EMPTY_MAP,
     )
 
-    log_path = ensure_audit_dir(vault_path)
-
-    # Append as JSON Lines format (one JSON object per line)
-    with log_path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(entry.to_dict()) + "\n")
+    # Append as JSON Lines format (one JSON object per line). O_APPEND positions
+    # each write at EOF, so concurrent writers do not overwrite each other.
+    _append_line(vault_path, (json.dumps(entry.to_dict()) + "\n").encode("utf-8"))
 
     return entry
 
 
-def read_audit_log(vault_path: Path, last_n: int | None = None) -> list[AuditEntry]:
+def _parse_entry(line: bytes | str) -> AuditEntry | None:
+    """Parse one JSON Lines record, returning None for blank or malformed lines."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        return AuditEntry.from_dict(json.loads(line))
+    except json.JSONDecodeError:
+        return None  # Skip malformed lines
+
+
+def _read_tail(log_path: Path, last_n: int, end_offset: int | None = None) -> list[AuditEntry]:
+    """Read the last `last_n` entries, scanning backwards from EOF.
+
+    Only the returned lines are parsed. When `end_offset` is given, bytes at
+    or past it are ignored, as if the file ended there.
+    """
+    tail: list[AuditEntry] = []
+    for line in iter_lines_reversed(log_path, end_offset):
+        entry = _parse_entry(line)
+        if entry is not None:
+            tail.append(entry)
+            if len(tail) >= last_n:
+                break
+    tail.reverse()
+    return tail
+
+
+def iter_audit_log(vault_path: Path) -> Iterator[AuditEntry]:
+    """
+    Lazily yield entries from the audit log, oldest first.
+
+    Memory use is constant regardless of log size; malformed lines are skipped.
+    """
+    log_path = get_audit_log_path(vault_path)
+    if not log_path.exists():
+        return
+
+    with log_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            entry = _parse_entry(line)
+            if entry is not None:
+                yield entry
+
+
+def follow_audit_log(
+    vault_path: Path,
+    poll_interval: float = 1.0,
+    start_offset: int | None = None,
+) -> Iterator[AuditEntry]:
+    """
+    Yield entries appended to the audit log (like `tail -f`).
+
+    Following starts at `start_offset` bytes into the log, or at its end when
+    no offset is given. Pass the offset a preceding tail read stopped at so
+    entries appended in between are not lost.
+
+    Blocks between polls and never returns on its own; callers stop it by
+    breaking out of the loop or interrupting the process.
+    """
+    log_path = get_audit_log_path(vault_path)
+    while not log_path.exists():
+        time.sleep(poll_interval)
+
+    with log_path.open("rb") as f:
+        if start_offset is None:
+            f.seek(0, 2)
+        else:
+            f.seek(start_offset)
+        pending = b""
+        while True:
+            line = f.readline()
+            if not line:
+                time.sleep(poll_interval)
+                continue
+            pending += line
+            if not pending.endswith(b"\n"):
+                continue  # Partial write; wait for the rest of the line
+            entry = _parse_entry(pending)
+            pending = b""
+            if entry is not None:
+                yield entry
+
+
+def read_audit_log(
+    vault_path: Path,
+    last_n: int | None = None,
+    end_offset: int | None = None,
+) -> list[AuditEntry]:
     """
     Read entries from the audit log.
 
     Args:
         vault_path: Path to the vault content directory
         last_n: If specified, return only the last N entries
+        end_offset: If specified with last_n, ignore bytes at or past this offset
 
     Returns:
         List of audit entries (oldest first unless last_n specified)
     """
-    log_path = get_audit_log_path(vault_path)
-    if not log_path.exists():
-        return []
-
-    entries = []
-    with log_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    data = json.loads(line)
-                    entries.append(AuditEntry.from_dict(data))
-                except json.JSONDecodeError:
-                    continue  # Skip malformed lines
+    if last_n is not None and last_n > 0:
+        log_path = get_audit_log_path(vault_path)
+        if not log_path.exists():
+            return []
+        return _read_tail(log_path, last_n, end_offset)
 
+    entries = list(iter_audit_log(vault_path))
     if last_n is not None:
         return entries[-last_n:]
     return entries
@@ -0,0 +1,5 @@
+"""Click command definitions, imported lazily by `irrev.cli`.
+
+Each module defines the click command or group for one top-level
+subcommand; command bodies defer heavy imports to `irrev.commands`.
+"""
@@ -0,0 +1,38 @@
+"""Click parameter types and helpers shared across command modules.
+
+Built once at import; identical choice sets reuse the same validator.
+"""
+
+import functools
+from pathlib import Path
+
+import click
+
+_FMT_MD_JSON = click.Choice(("md", "json"))
+_FMT_MD_JSON_TXT = click.Choice(("md", "json", "txt"))
+_VIA_CHOICES = click.Choice(("links", "depends_on", "both"))
+_ROLE_CHOICES = click.Choice(("domain", "projection", "paper", "diagnostic", "concept", "meta", "support", "invariant"))
+_SEVERITY_CHOICES = click.Choice(("warn", "fail", "enforce", "all"))
+
+# Option decorators repeated verbatim across commands.
+_OPT_FMT_MD_JSON = click.option(
+    "--format",
+    "output_format",
+    type=_FMT_MD_JSON,
+    default="md",
+    show_default=True,
+    help="Output format",
+)
+_OPT_OUT_FILE = click.option(
+    "--out", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write output to a file"
+)
+_OPT_JSON_OUTPUT = click.option("--json", "output_json", is_flag=True, help="Output as JSON")
+
+
+@functools.lru_cache(maxsize=1)
+def _stderr_console():
+    """Shared rich console on stderr, created (and rich imported) on first use."""
+    from rich.console import Console
+
+    return Console(stderr=True)
+
@@ -0,0 +1,164 @@
+"""Click wiring for the `irrev artifact` group."""
+
+import click
+
+from ._options import _OPT_JSON_OUTPUT, _SEVERITY_CHOICES
+
+
+@click.group()
+def artifact() -> None:
+    """Artifact ledger utilities (event-sourced)."""
+    pass
+
+
+@artifact.command("list")
+@click.option("--type", "artifact_type", type=str, default=None, help="Filter by artifact type (plan, approval, report)")
+@click.option("--status", type=str, default=None, help="Filter by status (created, validated, approved, executed, rejected)")
+@click.pass_context
+def artifact_list(ctx: click.Context, artifact_type: str | None, status: str | None) -> None:
+    """List artifacts from the append-only artifact ledger."""
+    from ..commands import run_artifact_list
+
+    ctx.exit(run_artifact_list(ctx.obj.vault, artifact_type=artifact_type, status=status))
+
+
+@artifact.command("show")
+@click.argument("artifact_id", type=str)
+@click.option("--json", "output_json", is_flag=True, help="Include stored content in JSON output")
+@click.pass_context
+def artifact_show(ctx: click.Context, artifact_id: str, output_json: bool) -> None:
+    """Show an artifact snapshot (and optionally its stored content)."""
+    from ..commands import run_artifact_show
+
+    ctx.exit(run_artifact_show(ctx.obj.vault, artifact_id, output_json=output_json))
+
+
+@artifact.command("status")
+@click.argument("artifact_id", type=str)
+@click.pass_context
+def artifact_status(ctx: click.Context, artifact_id: str) -> None:
+    """Show lifecycle status and next required gate."""
+    from ..commands import run_artifact_status
+
+    ctx.exit(run_artifact_status(ctx.obj.vault, artifact_id))
+
+
+@artifact.command("explain")
+@click.argument("artifact_id", type=str)
+@click.pass_context
+def artifact_explain(ctx: click.Context, artifact_id: str) -> None:
+    """Explain computed risk and approval requirements."""
+    from ..commands import run_artifact_explain
+
+    ctx.exit(run_artifact_explain(ctx.obj.vault, artifact_id))
+
+
+@artifact.command("approve")
+@click.argument("artifact_id", type=str)
+@click.option("--approver", type=str, default="human:local", show_default=True, help="Approver identity")
+@click.option("--scope", type=str, default=None, help="Approval scope string")
+@click.option("--force", is_flag=True, help="Acknowledge destructive approval (force_ack)")
+@click.pass_context
+def artifact_approve(ctx: click.Context, artifact_id: str, approver: str, scope: str | None, force: bool) -> None:
+    """Approve a validated artifact by creating an approval artifact."""
+    from ..commands import run_artifact_approve
+
+    ctx.exit(run_artifact_approve(ctx.obj.vault, artifact_id, approver=approver, force=force, scope=scope))
+
+
+@artifact.command("audit")
+@click.argument("artifact_id", type=str)
+@_OPT_JSON_OUTPUT
+@click.option("--limit", type=int, default=None, help="Limit number of events")
+@click.pass_context
+def artifact_audit(ctx: click.Context, artifact_id: str, output_json: bool, limit: int | None) -> None:
+    """Show full chronological audit trail for an artifact."""
+    from ..commands import run_artifact_audit
+
+    ctx.exit(run_artifact_audit(ctx.obj.vault, artifact_id, output_json=output_json, limit=limit))
+
+
+@artifact.command("execution")
+@click.argument("artifact_id", type=str, required=False)
+@click.option("--execution-id", type=str, default=None, help="Filter by execution ID")
+@click.option("--phase", type=str, default=None, help="Filter by phase (prepare|execute|commit)")
+@click.option("--status", type=str, default=None, help="Filter by status (started|completed|failed|skipped)")
+@_OPT_JSON_OUTPUT
+@click.pass_context
+def artifact_execution(ctx: click.Context, artifact_id: str | None, execution_id: str | None, phase: str | None, status: str | None, output_json: bool) -> None:
+    """Show execution logs for an artifact or execution_id."""
+    from ..commands import run_artifact_execution
+
+    ctx.exit(run_artifact_execution(ctx.obj.vault, artifact_id, execution_id=execution_id, phase=phase, status=status, output_json=output_json))
+
+
+@artifact.command("constraints")
+@click.argument("artifact_id", type=str)
+@click.option("--ruleset", type=str, default=None, help="Filter by ruleset ID")
+@click.option("--result", type=str, default=None, help="Filter by result (pass|fail|warning)")
+@click.option("--status", type=str, default=None, help="Filter invariant checks by status (pass|fail)")
+@_OPT_JSON_OUTPUT
+@click.pass_context
+def artifact_constraints(ctx: click.Context, artifact_id: str, ruleset: str | None, result: str | None, status: str | None, output_json: bool) -> None:
+    """Show constraint evaluations and invariant checks for an artifact."""
+    from ..commands import run_artifact_constraints
+
+    ctx.exit(run_artifact_constraints(ctx.obj.vault, artifact_id, ruleset=ruleset, result=result, status=status, output_json=output_json))
+
+
+@artifact.command("timeline")
+@click.argument("artifact_id", type=str)
+@click.option("--full", is_flag=True, help="Show full timestamps (not condensed)")
+@click.option("--limit", type=int, default=None, help="Limit number of events")
+@_OPT_JSON_OUTPUT
+@click.pass_context
+def artifact_timeline(ctx: click.Context, artifact_id: str, full: bool, limit: int | None, output_json: bool) -> None:
+    """Show condensed chronological timeline for an artifact."""
+    from ..commands import run_artifact_timeline
+
+    ctx.exit(run_artifact_timeline(ctx.obj.vault, artifact_id, full=full, limit=limit, output_json=output_json))
+
+
+@artifact.command("summary")
+@click.argument("artifact_id", type=str)
+@click.option("--execution-id", type=str, default=None, help="Specific execution ID (defaults to latest)")
+@_OPT_JSON_OUTPUT
+@click.pass_context
+def artifact_summary(ctx: click.Context, artifact_id: str, execution_id: str | None, output_json: bool) -> None:
+    """Show combined execution + constraint summary for an artifact."""
+    from ..commands import run_artifact_summary
+
+    ctx.exit(run_artifact_summary(ctx.obj.vault, artifact_id, execution_id=execution_id, output_json=output_json))
+
+
+@artifact.command("types")
+@_OPT_JSON_OUTPUT
+@click.pass_context
+def artifact_types(ctx: click.Context, output_json: bool) -> None:
+    """List all registered artifact types (vault + artifact system)."""
+    from ..commands import run_artifact_types_list
+
+    ctx.exit(run_artifact_types_list(ctx.obj.vault, json_output=output_json))
+
+
+@artifact.command("type-check")
+@click.argument("path", type=str)
+@click.option("--severity", type=_SEVERITY_CHOICES, default="all", help="Filter by severity level")
+@_OPT_JSON_OUTPUT
+@click.pass_context
+def artifact_type_check(ctx: click.Context, path: str, severity: str, output_json: bool) -> None:
+    """Dry-run validation on file or directory against type registry."""
+    from ..commands import run_artifact_type_check
+
+    ctx.exit(run_artifact_type_check(ctx.obj.vault, path, severity_filter=severity, json_output=output_json))
+
+
+@artifact.command("type-info")
+@click.argument("type_id", type=str)
+@_OPT_JSON_OUTPUT
+@click.pass_context
+def artifact_type_info(ctx: click.Context, type_id: str, output_json: bool) -> None:
+    """Show detailed information for one artifact type."""
+    from ..commands import run_artifact_type_info
+
+    ctx.exit(run_artifact_type_info(ctx.obj.vault, type_id, json_output=output_json))
@@ -0,0 +1,78 @@
+"""Click wiring for `irrev audit` and `irrev audit-log`."""
+
+from pathlib import Path
+
+import click
+
+
+@click.command()
+@click.argument(
+    "csv_folder",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path, resolve_path=True),
+)
+@click.option(
+    "--out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write output to a file (default: stdout)",
+)
+@click.pass_context
+def audit(ctx: click.Context, csv_folder: Path, out: Path | None) -> None:
+    """Generate structural vault report from CSV exports.
+
+    Parses Obsidian Bases CSV exports and generates a Markdown report
+    using the irreversibility accounting framework vocabulary.
+
+    CSV_FOLDER should contain exports like:
+
+    \b
+    - Concept topology.csv
+    - Dependency audit.csv
+    - Primitive coverage audit.csv
+    - Diagnostics inventory.csv
+    - Projections.csv
+    - Invariants inventory.csv
+    - Full vault audit.csv
+
+    Examples:
+
+        irrev audit "./content/exports bases"
+
+        irrev audit "./content/exports bases" --out report.md
+    """
+    from ..commands import run_audit
+
+    exit_code = run_audit(csv_folder, out=out)
+    ctx.exit(exit_code)
+
+
+@click.command("audit-log")
+@click.option("--tail", "tail_n", type=click.IntRange(min=1), default=20, show_default=True, help="Show the last N entries")
+@click.option("--follow", "-f", is_flag=True, help="Keep printing entries as they are appended (Ctrl+C to stop)")
+@click.pass_context
+def audit_log(ctx: click.Context, tail_n: int, follow: bool) -> None:
+    """Show the erasure-cost audit log (.irrev/audit.log).
+
+    Examples:
+
+        irrev audit-log --tail 50
+
+        irrev audit-log --follow
+    """
+    from ..audit_log import follow_audit_log, format_audit_entry, get_audit_log_path, read_audit_log
+
+    # Pin the end of the tail so --follow resumes exactly where it stopped.
+    log_path = get_audit_log_path(ctx.obj.vault)
+    end_offset = log_path.stat().st_size if log_path.exists() else 0
+
+    for entry in read_audit_log(ctx.obj.vault, last_n=tail_n, end_offset=end_offset):
+        print(format_audit_entry(entry))
+
+    if follow:
+        try:
+            for entry in follow_audit_log(ctx.obj.vault, start_offset=end_offset):
+                print(format_audit_entry(entry), flush=True)
+        except KeyboardInterrupt:
+            pass
+
+    ctx.exit(0)
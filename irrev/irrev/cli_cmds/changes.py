@@ -0,0 +1,177 @@
+"""Click wiring for the `irrev changes` group (change accounting)."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from ._options import _OPT_JSON_OUTPUT, _stderr_console
+
+
+@click.group()
+def changes() -> None:
+    """Change accounting - structural event tracking.
+
+    Treats structural changes as typed events that can be audited.
+    Per Failure Mode #10: account for what the lens itself displaces.
+    """
+    pass
+
+
+@changes.command("summary")
+@click.pass_context
+def changes_summary(ctx: click.Context) -> None:
+    """Show summary of structural changes over time."""
+    from ..ledger import ChangeAccountingLedger
+
+    ledger = ChangeAccountingLedger(ctx.obj.vault)
+    print(ledger.format_summary())
+
+
+@changes.command("record")
+@click.argument("note_id", type=str)
+@click.option("--before", type=click.Path(exists=True, path_type=Path), help="Path to before-state file")
+@click.option("--after", type=click.Path(exists=True, path_type=Path), help="Path to after-state file")
+@click.option("--commit", type=str, default=None, help="Git commit SHA for provenance")
+@click.pass_context
+def changes_record(
+    ctx: click.Context,
+    note_id: str,
+    before: Path | None,
+    after: Path | None,
+    commit: str | None,
+) -> None:
+    """Record a structural change event.
+
+    Compare before/after content and append a typed event to the ledger.
+    """
+    from ..ledger import ChangeAccountingLedger
+    from ..ledger.classifier import classify_file_change
+
+    event = classify_file_change(note_id, before, after, git_commit=commit)
+
+    ledger = ChangeAccountingLedger(ctx.obj.vault)
+    ledger.append(event)
+
+    # click.echo strips the style when stderr is not a terminal; no rich needed
+    click.echo(click.style(f"Recorded: {note_id}", fg="green"), err=True)
+    click.echo(f"  Types: {[ct.value for ct in event.change_types]}", err=True)
+    click.echo(f"  Ambiguity delta: {event.ambiguity_delta:+d}", err=True)
+
+
+@changes.command("record-bulk")
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--workers", type=click.IntRange(min=1), default=None, help="Worker processes (default: CPU count)")
+@click.pass_context
+def changes_record_bulk(ctx: click.Context, manifest: Path, workers: int | None) -> None:
+    """Record many structural change events from a JSON manifest.
+
+    MANIFEST is a JSON list of objects with `note_id` and optional `before`,
+    `after` and `commit` keys. Relative paths resolve against the manifest's
+    directory. Events are appended in manifest order.
+    """
+    import json as json_module
+    from ..ledger import classify_many, ChangeAccountingLedger
+
+    def _bad(message: str) -> click.BadParameter:
+        return click.BadParameter(message, param_hint="MANIFEST")
+
+    try:
+        raw = json_module.loads(manifest.read_text(encoding="utf-8"))
+    except json_module.JSONDecodeError as e:
+        raise _bad(f"invalid JSON: {e}")
+    if not isinstance(raw, list):
+        raise _bad("manifest must be a JSON list")
+
+    # Validate every entry up front so a bad one fails before any work is done
+    entries: list[tuple[str, Path | None, Path | None, str | None]] = []
+    for i, item in enumerate(raw):
+        if not isinstance(item, dict):
+            raise _bad(f"entry {i}: expected an object")
+        note_id = item.get("note_id")
+        if not isinstance(note_id, str) or not note_id:
+            raise _bad(f"entry {i}: 'note_id' must be a non-empty string")
+        paths: list[Path | None] = []
+        for key in ("before", "after"):
+            value = item.get(key)
+            if value is None or value == "":
+                paths.append(None)
+                continue
+            if not isinstance(value, str):
+                raise _bad(f"{note_id}: '{key}' must be a path string")
+            path = manifest.parent / value
+            if not path.is_file():
+                raise _bad(f"{note_id}: '{key}' is not a file: {path}")
+            paths.append(path)
+        commit = item.get("commit")
+        if commit is not None and not isinstance(commit, str):
+            raise _bad(f"{note_id}: 'commit' must be a string")
+        entries.append((note_id, paths[0], paths[1], commit))
+
+    events = classify_many(entries, max_workers=workers)
+    written = ChangeAccountingLedger(ctx.obj.vault).append_many(events)
+
+    click.echo(click.style(f"Recorded {written} events", fg="green"), err=True)
+
+
+@changes.command("show")
+@click.option("--note", type=str, default=None, help="Filter by note ID")
+@click.option("--type", "change_type", type=str, default=None, help="Filter by change type")
+@click.option("--limit", type=int, default=20, help="Max events to show")
+@_OPT_JSON_OUTPUT
+@click.pass_context
+def changes_show(
+    ctx: click.Context,
+    note: str | None,
+    change_type: str | None,
+    limit: int,
+    output_json: bool,
+) -> None:
+    """Show recent change events from the ledger.
+
+    With --json, events are written as newline-delimited JSON (one per line).
+    """
+    from ..ledger import ChangeAccountingLedger, ChangeEvent, ChangeType
+
+    ledger = ChangeAccountingLedger(ctx.obj.vault)
+
+    ct: ChangeType | None = None
+    if change_type:
+        try:
+            ct = ChangeType(change_type)
+        except ValueError:
+            _stderr_console().print(f"Unknown change type: {change_type}", style="red")
+            ctx.exit(1)
+
+    note_lc = note.lower() if note else None
+
+    def _matches(e: ChangeEvent) -> bool:
+        if note_lc and note_lc not in e.note_id.lower():
+            return False
+        return ct is None or ct in e.change_types
+
+    if limit > 0:
+        # Most recent events, scanning back from the end of the ledger
+        events = ledger.read_tail(limit, where=_matches)
+    else:
+        events = [e for e in ledger.iter_events() if _matches(e)]
+
+    if output_json:
+        from ..commands._ndjson import write_ndjson
+
+        write_ndjson(e.to_dict() for e in events)
+    else:
+        # Build the whole listing and write it once rather than print per line
+        lines: list[str] = []
+        append = lines.append
+        for e in events:
+            append(f"{e.timestamp.isoformat()} {e.note_id}")
+            append(f"  Types: {[ct.value for ct in e.change_types]}")
+            if e.structural_effects.dependencies_added:
+                append(f"  Deps added: {', '.join(e.structural_effects.dependencies_added)}")
+            if e.structural_effects.dependencies_removed:
+                append(f"  Deps removed: {', '.join(e.structural_effects.dependencies_removed)}")
+            append(f"  Ambiguity: {e.ambiguity_delta:+d}")
+            append("")
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
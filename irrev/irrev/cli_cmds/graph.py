@@ -0,0 +1,81 @@
+"""Click wiring for `irrev graph` and `irrev communities`."""
+
+from pathlib import Path
+
+import click
+
+from ._options import _FMT_MD_JSON, _OPT_OUT_FILE, _VIA_CHOICES
+
+
+@click.command()
+@click.option(
+    "--concepts-only/--all-notes",
+    "concepts_only",
+    default=True,
+    show_default=True,
+    help="Use concept structural dependencies only, or include all-note wiki-links",
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["rich", "md", "json", "dot", "svg", "html"]),
+    default="md",
+    show_default=True,
+    help="Output format",
+)
+@click.option(
+    "--styled/--plain",
+    "styled",
+    default=True,
+    show_default=True,
+    help="For dot/svg/html output: annotate nodes with layer colors and hub class badges",
+)
+@_OPT_OUT_FILE
+@click.option("--top", type=int, default=25, show_default=True, help="How many nodes to show in top lists")
+@click.pass_context
+def graph(
+    ctx: click.Context,
+    concepts_only: bool,
+    fmt: str,
+    styled: bool,
+    out: Path | None,
+    top: int,
+) -> None:
+    """Inspect dependency/link graph structure."""
+    from ..commands import run_graph
+
+    exit_code = run_graph(ctx.obj.vault, concepts_only=concepts_only, fmt=fmt, out=out, top=top, styled=styled)
+    ctx.exit(exit_code)
+
+
+@click.command("communities")
+@click.option(
+    "--mode",
+    type=_VIA_CHOICES,
+    default="links",
+    show_default=True,
+    help="How to build the concept graph before community detection",
+)
+@click.option(
+    "--algorithm",
+    type=click.Choice(["greedy", "lpa"]),
+    default="greedy",
+    show_default=True,
+    help="Community detection algorithm",
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=_FMT_MD_JSON,
+    default="md",
+    show_default=True,
+    help="Output format",
+)
+@_OPT_OUT_FILE
+@click.option("--max-iter", type=int, default=50, show_default=True, help="Label propagation iterations")
+@click.pass_context
+def communities(ctx: click.Context, mode: str, algorithm: str, fmt: str, out: Path | None, max_iter: int) -> None:
+    """Run community detection on concepts and compare to declared layers."""
+    from ..commands import run_communities
+
+    ctx.exit(run_communities(ctx.obj.vault, mode=mode, algorithm=algorithm, out=out, fmt=fmt, max_iter=max_iter))
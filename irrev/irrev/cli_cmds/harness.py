@@ -0,0 +1,207 @@
+"""Click wiring for the `irrev harness` group (unified execution chokepoint)."""
+
+import json
+
+import click
+
+from ._options import _stderr_console
+
+
+@click.group()
+def harness() -> None:
+    """Execution harness - single chokepoint for all effectful operations.
+
+    The harness enforces governance invariants architecturally:
+
+    \b
+    - propose: Compute plan, derive risk, create artifact (pure)
+    - execute: Verify approval, execute handler, emit bundle (impure)
+    - run: Convenience wrapper (propose + execute if no approval required)
+
+    Key principle: operations cannot bypass gates without leaving audit scars.
+    """
+    pass
+
+
+@harness.command("propose")
+@click.argument("operation", type=str)
+@click.option("--params", type=str, default="{}", help="JSON params for operation")
+@click.option("--actor", type=str, default="agent:cli", help="Actor identity")
+@click.pass_context
+def harness_propose(ctx: click.Context, operation: str, params: str, actor: str) -> None:
+    """Compute plan and create artifact (pure, no execution).
+
+    Examples:
+
+        irrev harness propose neo4j.load --params '{"http_uri":"http://localhost:7474","database":"irrev","mode":"sync"}'
+
+        irrev harness propose neo4j.load --params '{"http_uri":"http://localhost:7474","database":"irrev","mode":"rebuild"}'
+
+    Returns the plan_id, risk_class, and whether approval is required.
+    """
+    from ..harness import Harness
+    from ..harness.registry import get_handler
+    from ..harness.handlers import register_all
+
+    console = _stderr_console()
+
+    # Register all handlers
+    register_all()
+
+    # Get handler
+    handler = get_handler(operation)
+    if handler is None:
+        console.print(f"Unknown operation: {operation}", style="bold red")
+        console.print("Available operations: neo4j.load", style="dim")
+        ctx.exit(1)
+
+    # Parse params
+    try:
+        params_dict = json.loads(params)
+    except json.JSONDecodeError as e:
+        console.print(f"Invalid JSON params: {e}", style="bold red")
+        ctx.exit(1)
+
+    # Run propose
+    harness_instance = Harness(ctx.obj.vault, console=console)
+    result = harness_instance.propose(handler, params_dict, actor=actor, surface="cli")
+
+    if not result.success:
+        console.print(f"Validation failed: {'; '.join(result.validation_errors)}", style="bold red")
+        ctx.exit(1)
+
+    ctx.exit(0)
+
+
+@harness.command("execute")
+@click.argument("plan_id", type=str)
+@click.option("--secrets-ref", type=str, default=None, help="Secrets reference (e.g., 'env:NEO4J_PASSWORD')")
+@click.option("--dry-run", is_flag=True, help="Show plan but don't execute")
+@click.pass_context
+def harness_execute(ctx: click.Context, plan_id: str, secrets_ref: str | None, dry_run: bool) -> None:
+    """Execute an approved plan artifact.
+
+    Requires the plan to be approved first:
+
+        irrev artifact approve <plan_id> --approver human:alice --force
+
+    Examples:
+
+        irrev harness execute 01HYK... --secrets-ref env:NEO4J_PASSWORD
+
+        irrev harness execute 01HYK... --dry-run
+    """
+    from ..harness import Harness
+    from ..harness.registry import get_handler
+    from ..harness.handlers import register_all
+
+    console = _stderr_console()
+
+    # Register all handlers
+    register_all()
+
+    # Create harness
+    harness_instance = Harness(ctx.obj.vault, console=console)
+
+    # Get plan snapshot to determine handler
+    snap = harness_instance.plan_manager.ledger.snapshot(plan_id)
+    if snap is None:
+        console.print(f"Plan not found: {plan_id}", style="bold red")
+        ctx.exit(1)
+
+    # Get operation from plan
+    content = harness_instance.content_store.get(snap.content_id)
+    if not isinstance(content, dict):
+        console.print(f"Invalid plan content: {snap.content_id}", style="bold red")
+        ctx.exit(1)
+
+    operation = str(content.get("operation", "")).strip()
+    handler = get_handler(operation)
+    if handler is None:
+        console.print(f"Unknown operation: {operation}", style="bold red")
+        ctx.exit(1)
+
+    # Execute
+    result = harness_instance.execute(
+        plan_id,
+        handler,
+        executor=handler.metadata.delegate_to,
+        secrets_ref=secrets_ref,
+        dry_run=dry_run,
+    )
+
+    if not result.success:
+        console.print(f"Execution failed: {result.error}", style="bold red")
+        ctx.exit(1)
+
+    ctx.exit(0)
+
+
+@harness.command("run")
+@click.argument("operation", type=str)
+@click.option("--params", type=str, default="{}", help="JSON params for operation")
+@click.option("--actor", type=str, default="agent:cli", help="Actor identity")
+@click.option("--secrets-ref", type=str, default=None, help="Secrets reference (e.g., 'env:NEO4J_PASSWORD')")
+@click.option("--dry-run", is_flag=True, help="Show plan but don't execute")
+@click.pass_context
+def harness_run(
+    ctx: click.Context,
+    operation: str,
+    params: str,
+    actor: str,
+    secrets_ref: str | None,
+    dry_run: bool,
+) -> None:
+    """Propose + execute in one call (only if no approval required).
+
+    For operations that require approval (destructive/external), this
+    will fail with an error - use propose + approve + execute instead.
+
+    Examples:
+
+        irrev harness run neo4j.load --params '{"http_uri":"...","database":"irrev","mode":"sync"}' --dry-run
+
+        # This will fail for mode=rebuild (requires approval):
+        irrev harness run neo4j.load --params '{"mode":"rebuild",...}'
+        # Error: Approval required (risk=mutation_destructive)
+    """
+    from ..harness import Harness
+    from ..harness.registry import get_handler
+    from ..harness.handlers import register_all
+
+    console = _stderr_console()
+
+    # Register all handlers
+    register_all()
+
+    # Get handler
+    handler = get_handler(operation)
+    if handler is None:
+        console.print(f"Unknown operation: {operation}", style="bold red")
+        console.print("Available operations: neo4j.load", style="dim")
+        ctx.exit(1)
+
+    # Parse params
+    try:
+        params_dict = json.loads(params)
+    except json.JSONDecodeError as e:
+        console.print(f"Invalid JSON params: {e}", style="bold red")
+        ctx.exit(1)
+
+    # Run
+    harness_instance = Harness(ctx.obj.vault, console=console)
+    result = harness_instance.run(
+        handler,
+        params_dict,
+        actor=actor,
+        surface="cli",
+        executor=handler.metadata.delegate_to,
+        secrets_ref=secrets_ref,
+        dry_run=dry_run,
+    )
+
+    if not result.success:
+        console.print(f"Failed: {result.error}", style="bold red")
+        ctx.exit(1)
+
+    ctx.exit(0)
@@ -0,0 +1,160 @@
+"""Click wiring for the `irrev junctions` group."""
+
+from pathlib import Path
+
+import click
+
+from ._options import _OPT_FMT_MD_JSON, _OPT_OUT_FILE, _ROLE_CHOICES, _VIA_CHOICES
+
+
+@click.group()
+def junctions() -> None:
+    """Detect routing pressure and candidate missing concepts."""
+    pass
+
+
+@junctions.command("concept-audit")
+@click.option("--top", type=int, default=25, show_default=True, help="How many concepts to audit (by in-degree)")
+@_OPT_FMT_MD_JSON
+@_OPT_OUT_FILE
+@click.option("--all", "include_all", is_flag=True, default=False, help="Audit all concepts (ignores --top)")
+@click.pass_context
+def junctions_concept_audit(
+    ctx: click.Context,
+    top: int,
+    output_format: str,
+    out: Path | None,
+    include_all: bool,
+) -> None:
+    """Generate a concept audit report (Phase 1)."""
+    from ..commands import run_concept_audit
+
+    exit_code = run_concept_audit(ctx.obj.vault, out=out, top=top, fmt=output_format, include_all=include_all)
+    ctx.exit(exit_code)
+
+
+@junctions.command("definition-analysis")
+@click.option("--top", type=int, default=25, show_default=True, help="How many concepts to analyze (by in-degree)")
+@_OPT_FMT_MD_JSON
+@_OPT_OUT_FILE
+@click.option("--all", "include_all", is_flag=True, default=False, help="Analyze all concepts (ignores --top)")
+@click.pass_context
+def junctions_definition_analysis(
+    ctx: click.Context,
+    top: int,
+    output_format: str,
+    out: Path | None,
+    include_all: bool,
+) -> None:
+    """Analyze definition semantics: verbs, patterns, implicit deps (Phase 1b).
+
+    Examines concept definitions for:
+
+    \b
+    - Verb patterns (state/action/modal/causal)
+    - Negation density and operational framing
+    - Cost language and spatial metaphors
+    - Implicit dependencies (mentioned but not linked)
+    - Role purity (prescriptive vs descriptive)
+    - Definition scope metrics (sentences vs NOT items)
+
+    Examples:
+
+        irrev junctions definition-analysis --top 10
+
+        irrev junctions definition-analysis --all --format json
+    """
+    from ..commands import run_definition_analysis
+
+    exit_code = run_definition_analysis(ctx.obj.vault, out=out, top=top, fmt=output_format, include_all=include_all)
+    ctx.exit(exit_code)
+
+
+@junctions.command("domain-audit")
+@click.option(
+    "--domain",
+    "domain_filter",
+    type=str,
+    default=None,
+    metavar="DOMAIN",
+    help='Limit to a single domain (matches name/title; e.g., --domain "Digital Platforms")',
+)
+@click.option(
+    "--via",
+    "via_mode",
+    type=_VIA_CHOICES,
+    default="links",
+    show_default=True,
+    help="How to compute the concept -> concept hop (links mirrors Neo4j LINKS_TO)",
+)
+@_OPT_FMT_MD_JSON
+@_OPT_OUT_FILE
+@click.pass_context
+def junctions_domain_audit(
+    ctx: click.Context,
+    domain_filter: str | None,
+    via_mode: str,
+    output_format: str,
+    out: Path | None,
+) -> None:
+    """Audit domains for implied concept dependencies (2-hop via concept depends_on)."""
+    from ..commands import run_domain_audit
+
+    exit_code = run_domain_audit(ctx.obj.vault, domain=domain_filter, via=via_mode, out=out, fmt=output_format)
+    ctx.exit(exit_code)
+
+
+@junctions.command("implicit")
+@click.option(
+    "--role",
+    "role_name",
+    type=_ROLE_CHOICES,
+    default="domain",
+    show_default=True,
+    help="Which note role to audit",
+)
+@click.option(
+    "--note",
+    "note_filter",
+    type=str,
+    default=None,
+    metavar="NOTE",
+    help='Limit to a single note (matches name/title; e.g., --note "OpenAI")',
+)
+@click.option(
+    "--via",
+    "via_mode",
+    type=_VIA_CHOICES,
+    default="links",
+    show_default=True,
+    help="How to compute the concept -> concept hop (links mirrors Neo4j LINKS_TO)",
+)
+@click.option("--top", type=int, default=25, show_default=True, help="How many notes to include (by implied count)")
+@click.option("--all", "include_all", is_flag=True, default=False, help="Audit all notes (ignores --top)")
+@_OPT_FMT_MD_JSON
+@_OPT_OUT_FILE
+@click.pass_context
+def junctions_implicit(
+    ctx: click.Context,
+    role_name: str,
+    note_filter: str | None,
+    via_mode: str,
+    top: int,
+    include_all: bool,
+    output_format: str,
+    out: Path | None,
+) -> None:
+    """Audit any note role for implied concept dependencies (2-hop) not declared by direct links."""
+    from ..commands import run_implicit_audit
+
+    exit_code = run_implicit_audit(
+        ctx.obj.vault,
+        role=role_name,
+        note=note_filter,
+        via=via_mode,
+        top=top,
+        include_all=include_all,
+        out=out,
+        fmt=output_format,
+    )
+    ctx.exit(exit_code)
@@ -0,0 +1,123 @@
+"""Click wiring for `irrev lint`."""
+
+import click
+
+_FAIL_ON = click.Choice(["error", "warning"])
+
+
+@click.command()
+@click.option(
+    "--fail-on",
+    type=_FAIL_ON,
+    default="error",
+    help="Exit with error if this level or higher found",
+)
+@click.option(
+    "--json",
+    "output_json",
+    is_flag=True,
+    help="Output results as JSON",
+)
+@click.option(
+    "--flat",
+    is_flag=True,
+    help="Use flat output (legacy) instead of invariant-grouped (default)",
+)
+@click.option(
+    "--invariant",
+    "invariant_filter",
+    type=str,
+    default=None,
+    metavar="INVARIANT_ID",
+    help="Only run rules for this invariant (e.g., --invariant decomposition)",
+)
+@click.option(
+    "--strict",
+    is_flag=True,
+    help="Treat unclassified rules as errors (prevents scope creep in CI)",
+)
+@click.option(
+    "--summary",
+    is_flag=True,
+    help="Print only invariant status line (for commits/docs)",
+)
+@click.option(
+    "--explain",
+    "explain_rule",
+    type=str,
+    default=None,
+    metavar="RULE_ID",
+    help="Explain a specific rule and exit (e.g., --explain layer-violation)",
+)
+@click.option(
+    "--explain-invariant",
+    "explain_invariant_id",
+    type=str,
+    default=None,
+    metavar="INVARIANT_ID",
+    help="Explain an invariant and its rules (e.g., --explain-invariant decomposition)",
+)
+@click.option(
+    "--trace",
+    "trace_note",
+    type=str,
+    default=None,
+    metavar="NOTE",
+    help="Show dependency chain for a specific note (e.g., --trace admissibility)",
+)
+@click.pass_context
+def lint(
+    ctx: click.Context,
+    fail_on: str,
+    output_json: bool,
+    flat: bool,
+    invariant_filter: str | None,
+    strict: bool,
+    summary: bool,
+    explain_rule: str | None,
+    explain_invariant_id: str | None,
+    trace_note: str | None,
+) -> None:
+    """Check vault for structural violations.
+
+    By default, results are grouped by invariant to surface infrastructure-level
+    failure modes. Use --flat for legacy file-based output.
+
+    The 4 kernel invariants:
+    - decomposition: Objects/operators separation, role boundaries, no function merging
+    - governance: Non-exemption, enforceability, self-correction surfaces
+    - attribution: Responsibility mapping, diagnostics can't prescribe, no misplaced blame
+    - irreversibility: Persistence, erasure cost declaration, accounting requirements, rollback denial
+
+    Structural rules (dependency-cycle, broken-link, alias-drift) ensure graph coherence,
+    which emerges from joint invariant compliance.
+
+    Use --explain RULE_ID to see detailed documentation for a rule.
+    Use --explain-invariant INVARIANT_ID to see what an invariant enforces.
+    Use --trace NOTE to see the dependency chain for a specific note.
+    """
+    # Handle --explain-invariant mode
+    if explain_invariant_id:
+        from ..commands import run_explain_invariant
+
+        exit_code = run_explain_invariant(explain_invariant_id)
+        ctx.exit(exit_code)
+
+    # Handle --explain mode
+    if explain_rule:
+        from ..commands import run_explain
+
+        exit_code = run_explain(explain_rule)
+        ctx.exit(exit_code)
+
+    # Handle --trace mode
+    if trace_note:
+        from ..commands import run_trace
+
+        exit_code = run_trace(ctx.obj.vault, trace_note)
+        ctx.exit(exit_code)
+
+    from ..commands import run_lint
+
+    exit_code = run_lint(ctx.obj.vault, fail_on, output_json, flat, invariant_filter, strict, summary)
+    ctx.exit(exit_code)
@@ -0,0 +1,42 @@
+"""Click wiring for `irrev lsp`."""
+
+import click
+
+
+@click.command("lsp")
+@click.option(
+    "--transport",
+    type=click.Choice(["stdio", "tcp"]),
+    default="stdio",
+    show_default=True,
+    help="Transport method (stdio for editors, tcp for debugging)",
+)
+@click.pass_context
+def lsp(ctx: click.Context, transport: str) -> None:
+    """Start the LSP server for live invariant awareness.
+
+    The LSP server provides:
+
+    \b
+    - Real-time lint diagnostics (on save)
+    - Hover info for wikilinks (concept layer, dependencies)
+    - Code actions as suggestions (not auto-apply)
+
+    For VSCode, configure the extension to use:
+
+        irrev lsp --transport stdio
+
+    For debugging with a TCP connection:
+
+        irrev lsp --transport tcp
+
+    Examples:
+
+        irrev -v ../content lsp
+
+        irrev -v ../content lsp --transport tcp
+    """
+    from ..lsp import start_server
+
+    vault_path = ctx.obj.vault
+    start_server(vault_path=vault_path, transport=transport)
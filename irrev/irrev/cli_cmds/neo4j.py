@@ -0,0 +1,330 @@
+"""Click wiring for the `irrev neo4j` group."""
+
+from pathlib import Path
+
+import click
+from click.core import ParameterSource
+
+from ..neo4j import DEFAULT_BATCH_SIZE
+from ._options import _stderr_console
+
+
+# Connection options shared by every neo4j subcommand, in --help order.
+_CONN_OPTS = (
+    click.option(
+        "--http-uri",
+        type=str,
+        default="http://localhost:7474",
+        show_default=True,
+        help="Neo4j HTTP base URL (transactional endpoint uses /db/<db>/tx/commit)",
+    ),
+    click.option("--user", type=str, default="neo4j", show_default=True, help="Neo4j username"),
+    click.option(
+        "--password",
+        type=str,
+        envvar="NEO4J_PASSWORD",
+        prompt=True,
+        hide_input=True,
+        help="Neo4j password (or set NEO4J_PASSWORD)",
+    ),
+    click.option("--database", type=str, default="irrev", show_default=True, help="Neo4j database name"),
+)
+
+
+def _neo4j_conn_options(f):
+    """Apply --http-uri/--user/--password/--database to a command."""
+    for opt in reversed(_CONN_OPTS):
+        f = opt(f)
+    return f
+
+
+@click.group()
+def neo4j() -> None:
+    """Neo4j export/load utilities (derived graph state)."""
+    pass
+
+
+@neo4j.command("ping")
+@_neo4j_conn_options
+@click.pass_context
+def neo4j_ping(ctx: click.Context, http_uri: str, user: str, password: str, database: str) -> None:
+    """Check Neo4j connectivity (non-destructive)."""
+    from ..commands import run_neo4j_ping
+
+    ctx.exit(run_neo4j_ping(http_uri=http_uri, user=user, password=password, database=database))
+
+
+@neo4j.command("load")
+@_neo4j_conn_options
+@click.option(
+    "--mode",
+    type=click.Choice(["sync", "rebuild"]),
+    default="sync",
+    show_default=True,
+    help="sync clears derived edges; rebuild wipes the database first",
+)
+@click.option(
+    "--ensure-schema/--no-ensure-schema",
+    default=True,
+    show_default=True,
+    help="Create constraints/indexes (Neo4j 5+ syntax)",
+)
+@click.option("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, show_default=True, help="Rows per UNWIND batch (one HTTP round trip each)")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Batches submitted in parallel within each load phase (--plan-id runs stay serial unless given)",
+)
+@click.option(
+    "--bulk-loader",
+    type=click.Choice(["http", "load_csv"]),
+    default="http",
+    show_default=True,
+    help="http sends UNWIND parameter batches; load_csv stages CSVs in --import-dir for server-side LOAD CSV",
+)
+@click.option(
+    "--import-dir",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    default=None,
+    help="Neo4j server import directory (server.directories.import), required for --bulk-loader load_csv",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Skip confirmation for destructive operations (required for --mode rebuild in non-interactive contexts)",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show what would be done without executing (diagnostic only)",
+)
+@click.option(
+    "--propose-only",
+    is_flag=True,
+    help="Create + validate an artifact plan, but do not execute",
+)
+@click.option(
+    "--plan-id",
+    type=str,
+    default=None,
+    metavar="ARTIFACT_ID",
+    help="Execute an approved artifact plan",
+)
+@click.pass_context
+def neo4j_load(
+    ctx: click.Context,
+    http_uri: str,
+    user: str,
+    password: str,
+    database: str,
+    mode: str,
+    ensure_schema: bool,
+    batch_size: int,
+    concurrency: int,
+    bulk_loader: str,
+    import_dir: Path | None,
+    force: bool,
+    dry_run: bool,
+    propose_only: bool,
+    plan_id: str | None,
+) -> None:
+    """Load the vault into Neo4j as a derived graph.
+
+    Examples:
+
+        irrev -v content neo4j load --database irrev
+
+        $env:NEO4J_PASSWORD="adminroot"; irrev -v content neo4j load --database irrev --mode rebuild --force
+    """
+    from ..commands import run_neo4j_load, run_neo4j_load_from_plan_id, run_neo4j_load_propose
+
+    if propose_only and plan_id:
+        raise click.BadParameter("--propose-only and --plan-id are mutually exclusive")
+    if propose_only and dry_run:
+        raise click.BadParameter("--propose-only and --dry-run are mutually exclusive")
+    if bulk_loader == "load_csv" and import_dir is None:
+        raise click.BadParameter("--bulk-loader load_csv requires --import-dir", param_hint="--import-dir")
+    if bulk_loader != "load_csv" and import_dir is not None:
+        raise click.BadParameter("--import-dir is only used with --bulk-loader load_csv", param_hint="--import-dir")
+    if propose_only:
+        # A proposal executes nothing, so execution-only options would be silently dropped.
+        for name in ("concurrency", "bulk_loader", "import_dir"):
+            if ctx.get_parameter_source(name) is not ParameterSource.DEFAULT:
+                hint = "--" + name.replace("_", "-")
+                raise click.BadParameter(f"{hint} has no effect with --propose-only", param_hint=hint)
+
+    if plan_id:
+        # Approved plans execute serially, like harness execute, unless asked otherwise
+        if ctx.get_parameter_source("concurrency") is ParameterSource.DEFAULT:
+            concurrency = 1
+        ctx.exit(
+            run_neo4j_load_from_plan_id(
+                ctx.obj.vault,
+                plan_id=plan_id,
+                http_uri=http_uri,
+                database=database,
+                mode=mode,
+                ensure_schema=ensure_schema,
+                batch_size=batch_size,
+                user=user,
+                password=password,
+                concurrency=concurrency,
+                import_dir=import_dir,
+            )
+        )
+
+    if propose_only:
+        ctx.exit(
+            run_neo4j_load_propose(
+                ctx.obj.vault,
+                http_uri=http_uri,
+                database=database,
+                mode=mode,
+                ensure_schema=ensure_schema,
+                batch_size=batch_size,
+                actor="agent:planner",
+            )
+        )
+
+    # Governance: destructive operations require explicit acknowledgment
+    if mode == "rebuild" and not dry_run:
+        console = _stderr_console()
+        console.print("[yellow]⚠ Governance notice:[/] --mode rebuild will wipe the database before loading.", style="dim")
+        console.print(f"  Target: {http_uri} database={database}", style="dim")
+        if not force:
+            if not click.confirm("Proceed with database wipe?"):
+                console.print("Aborted.", style="dim")
+                ctx.exit(1)
+
+    exit_code = run_neo4j_load(
+        ctx.obj.vault,
+        http_uri=http_uri,
+        user=user,
+        password=password,
+        database=database,
+        mode=mode,
+        ensure_schema=ensure_schema,
+        batch_size=batch_size,
+        dry_run=dry_run,
+        concurrency=concurrency,
+        import_dir=import_dir,
+    )
+    ctx.exit(exit_code)
+
+
+@neo4j.command("export")
+@_neo4j_conn_options
+@click.option(
+    "--out-dir",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    default=Path("exports/export"),
+    show_default=True,
+    help="Output directory (relative to the vault root unless absolute)",
+)
+@click.option(
+    "--stamp/--no-stamp",
+    default=True,
+    show_default=True,
+    help="Write into a dated subfolder (YYYY-MM-DD) for repeatable snapshots",
+)
+@click.option("--top", type=int, default=50, show_default=True, help="Row count for top-N exports")
+@click.option(
+    "--concept",
+    "concept_note_id",
+    type=str,
+    default="concepts/erasure-cost",
+    show_default=True,
+    help="Concept note_id used for touch/require exports",
+)
+@click.option(
+    "--include-mentions/--no-include-mentions",
+    default=True,
+    show_default=True,
+    help="Detect definition mentions and export semantic-implicit MENTIONS edges",
+)
+@click.option(
+    "--include-ghost-terms/--no-include-ghost-terms",
+    default=True,
+    show_default=True,
+    help="Detect unknown backticked terms in definitions and export ghost nodes",
+)
+@click.option(
+    "--include-definition-tokens/--no-include-definition-tokens",
+    default=False,
+    show_default=True,
+    help="Tokenize definitions into a filtered token graph (ghost vocabulary probe)",
+)
+@click.option("--token-min-df", type=int, default=2, show_default=True, help="Minimum concepts a token must appear in")
+@click.option("--token-max-df", type=int, default=8, show_default=True, help="Maximum concepts a token may appear in (0=unbounded)")
+@click.option("--token-top-per-concept", type=int, default=20, show_default=True, help="How many tokens to keep per concept")
+@click.option(
+    "--page-size",
+    type=click.IntRange(min=1),
+    default=10_000,
+    show_default=True,
+    help="Rows per page when exporting the full concept graph",
+)
+@click.option(
+    "--compress/--no-compress",
+    default=False,
+    show_default=True,
+    help="Write each file gzip'd (<name>.gz, level 1) to cut bytes written",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Top-N export queries run in parallel",
+)
+@click.pass_context
+def neo4j_export(
+    ctx: click.Context,
+    http_uri: str,
+    user: str,
+    password: str,
+    database: str,
+    out_dir: Path,
+    stamp: bool,
+    top: int,
+    concept_note_id: str,
+    include_mentions: bool,
+    include_ghost_terms: bool,
+    include_definition_tokens: bool,
+    token_min_df: int,
+    token_max_df: int,
+    token_top_per_concept: int,
+    page_size: int,
+    compress: bool,
+    concurrency: int,
+) -> None:
+    """Export a bundle of inspection artifacts (CSV/JSON) from Neo4j.
+
+    This is the “automatic way” to run the manual query pack and write files into
+    `content/exports/export/…` for your own inspection.
+    """
+    from ..commands import run_neo4j_export
+
+    exit_code = run_neo4j_export(
+        ctx.obj.vault,
+        http_uri=http_uri,
+        user=user,
+        password=password,
+        database=database,
+        out_dir=out_dir,
+        stamp=stamp,
+        top=top,
+        concept_note_id=concept_note_id,
+        include_mentions=include_mentions,
+        include_ghost_terms=include_ghost_terms,
+        include_definition_tokens=include_definition_tokens,
+        token_min_df=token_min_df,
+        token_max_df=token_max_df,
+        token_top_per_concept=token_top_per_concept,
+        page_size=page_size,
+        compress=compress,
+        concurrency=concurrency,
+    )
+    ctx.exit(exit_code)
@@ -0,0 +1,59 @@
+"""Click wiring for `irrev pack`."""
+
+import click
+
+from ._options import _FMT_MD_JSON_TXT
+
+_KIND = click.Choice(["domain", "concept", "projection"])
+
+
+@click.command()
+@click.argument("kind", type=_KIND)
+@click.argument("target")
+@click.option(
+    "--format",
+    "output_format",
+    type=_FMT_MD_JSON_TXT,
+    default="md",
+    help="Output format",
+)
+@click.option(
+    "--include-diagnostics",
+    is_flag=True,
+    help="Include diagnostic notes in pack",
+)
+@click.option(
+    "--explain",
+    is_flag=True,
+    help="Explain why each file is included",
+)
+@click.pass_context
+def pack(
+    ctx: click.Context,
+    kind: str,
+    target: str,
+    output_format: str,
+    include_diagnostics: bool,
+    explain: bool,
+) -> None:
+    """Generate context packs deterministically.
+
+    Examples:
+
+        irrev pack domain "2012-2026 AI Systems"
+
+        irrev pack concept irreversibility --explain
+
+        irrev pack projection Stoicism --include-diagnostics
+    """
+    from ..commands import run_pack
+
+    exit_code = run_pack(
+        ctx.obj.vault,
+        kind,
+        target,
+        output_format,
+        include_diagnostics,
+        explain,
+    )
+    ctx.exit(exit_code)
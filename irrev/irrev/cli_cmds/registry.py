@@ -0,0 +1,138 @@
+"""Click wiring for the `irrev registry` group."""
+
+from pathlib import Path
+
+import click
+
+_NOTICE_IN_PLACE = click.style("⚠ Governance notice:", fg="yellow") + click.style(
+    " --in-place will modify the Registry note directly.", dim=True
+)
+
+
+def _default_overrides(vault: Path) -> Path | None:
+    """Return <vault>/meta/registry.overrides.yml if it exists."""
+    path = vault.joinpath("meta", "registry.overrides.yml")
+    return path if path.is_file() else None
+
+
+@click.group()
+def registry() -> None:
+    """Registry generation commands."""
+    pass
+
+
+@registry.command("build")
+@click.option(
+    "--out",
+    type=click.Path(dir_okay=False),
+    help="Output file path (default: stdout)",
+)
+@click.option(
+    "--in-place",
+    is_flag=True,
+    help="Update existing registry note in-place (preserves narrative; replaces generated region)",
+)
+@click.option(
+    "--overrides",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Optional YAML overrides file for ordering/roles (default: <vault>/meta/registry.overrides.yml if present)",
+)
+@click.option(
+    "--allow-unknown-layers",
+    is_flag=True,
+    help="Allow concepts with layers not present in LAYER_ORDER (emits an Unclassified section)",
+)
+@click.option(
+    "--registry-path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path, resolve_path=True),
+    default=None,
+    help="Explicit registry markdown path (for in-place updates or diffs)",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show what would be done without executing (diagnostic only)",
+)
+@click.pass_context
+def registry_build(
+    ctx: click.Context,
+    out: str | None,
+    in_place: bool,
+    overrides: Path | None,
+    allow_unknown_layers: bool,
+    registry_path: Path | None,
+    dry_run: bool,
+) -> None:
+    """Generate registry from vault concepts.
+
+    Reads concept layers and dependencies, produces markdown tables
+    matching the Registry format.
+
+    Examples:
+
+        irrev registry build
+
+        irrev registry build --out Registry.generated.md
+    """
+    from ..commands import run_build
+
+    # Governance: in-place modification is a write operation
+    if in_place:
+        click.echo(_NOTICE_IN_PLACE, err=True)
+
+    overrides_path = overrides or _default_overrides(ctx.obj.vault)
+
+    exit_code = run_build(
+        ctx.obj.vault,
+        out,
+        in_place=in_place,
+        overrides=overrides_path,
+        allow_unknown_layers=allow_unknown_layers,
+        registry_path=registry_path,
+        dry_run=dry_run,
+    )
+    ctx.exit(exit_code)
+
+
+@registry.command("diff")
+@click.option(
+    "--overrides",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Optional YAML overrides file for ordering/roles (default: <vault>/meta/registry.overrides.yml if present)",
+)
+@click.option(
+    "--allow-unknown-layers",
+    is_flag=True,
+    help="Allow concepts with layers not present in LAYER_ORDER (emits an Unclassified section)",
+)
+@click.option(
+    "--registry-path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path, resolve_path=True),
+    default=None,
+    help="Explicit registry markdown path to compare against",
+)
+@click.pass_context
+def registry_diff(
+    ctx: click.Context,
+    overrides: Path | None,
+    allow_unknown_layers: bool,
+    registry_path: Path | None,
+) -> None:
+    """Compare generated registry with existing Registry file.
+
+    Shows differences between what the concepts define and what
+    the Registry file contains.
+    """
+    from ..commands import run_diff
+
+    overrides_path = overrides or _default_overrides(ctx.obj.vault)
+
+    exit_code = run_diff(
+        ctx.obj.vault,
+        overrides=overrides_path,
+        allow_unknown_layers=allow_unknown_layers,
+        registry_path=registry_path,
+    )
+    ctx.exit(exit_code)
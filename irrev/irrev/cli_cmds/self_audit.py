@@ -0,0 +1,63 @@
+"""Click wiring for `irrev self-audit`."""
+
+from pathlib import Path
+
+import click
+
+
+@click.command("self-audit")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json", "md"]),
+    default="text",
+    show_default=True,
+    help="Output format",
+)
+@click.option(
+    "--include-passing",
+    is_flag=True,
+    help="Include passing checks in output",
+)
+@click.option(
+    "--target",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Directory to scan (defaults to irrev package)",
+)
+@click.pass_context
+def self_audit(
+    ctx: click.Context,
+    output_format: str,
+    include_passing: bool,
+    target: Path | None,
+) -> None:
+    """Meta-lint the linter itself.
+
+    Runs self-audit scanners against the irrev codebase to detect:
+
+    \b
+    - Prescriptive language in strings/docstrings
+    - Self-exemption patterns (bypass mechanisms)
+    - Force gate coverage (destructive ops without --force)
+    - Audit logging coverage (state changes without logging)
+
+    Per Failure Mode #10: "The most serious failure mode is assuming
+    the lens already accounts for its own limitations."
+
+    Examples:
+
+        irrev self-audit
+
+        irrev self-audit --format md
+
+        irrev self-audit --format json > findings.json
+    """
+    from ..commands import run_self_audit
+
+    exit_code = run_self_audit(
+        target=target,
+        output_format=output_format,
+        include_passing=include_passing,
+    )
+    ctx.exit(exit_code)
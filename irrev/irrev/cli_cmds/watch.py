@@ -0,0 +1,126 @@
+"""Click wiring for the `irrev watch` group (structural event logging)."""
+
+import click
+
+
+@click.group()
+def watch() -> None:
+    """Observe vault drift as structural events.
+
+    Watches for file system changes and logs them to .irrev/events.log.
+    Per the Irreversibility invariant: "Persistence must be tracked."
+    """
+    pass
+
+
+@watch.command("start")
+@click.option(
+    "--hash/--no-hash",
+    "include_hash",
+    default=False,
+    show_default=True,
+    help="Compute and log file content hashes",
+)
+@click.option(
+    "--frontmatter/--no-frontmatter",
+    "include_frontmatter",
+    default=False,
+    show_default=True,
+    help="Extract and log frontmatter role/layer",
+)
+@click.option(
+    "--scope",
+    "scopes",
+    multiple=True,
+    default=None,
+    help="Filter to specific scopes (vault_note, registry, rules, config). Repeatable.",
+)
+@click.pass_context
+def watch_start(
+    ctx: click.Context,
+    include_hash: bool,
+    include_frontmatter: bool,
+    scopes: tuple[str, ...],
+) -> None:
+    """Start watching the vault for file changes.
+
+    Runs until interrupted (Ctrl+C). Events are logged to .irrev/events.log.
+
+    Examples:
+
+        irrev watch start
+
+        irrev watch start --hash --frontmatter
+
+        irrev watch start --scope vault_note --scope registry
+    """
+    from ..commands import run_watch
+
+    run_watch(
+        ctx.obj.vault,
+        include_hash=include_hash,
+        include_frontmatter=include_frontmatter,
+        scopes=set(scopes) if scopes else None,
+    )
+
+
+@watch.command("events")
+@click.option("--last", "last_n", type=int, default=None, help="Show only the last N events")
+@click.option(
+    "--kind",
+    "event_kinds",
+    multiple=True,
+    default=None,
+    help="Filter by event kind (file_created, file_modified, file_deleted, file_renamed). Repeatable.",
+)
+@click.option(
+    "--scope",
+    "scopes",
+    multiple=True,
+    default=None,
+    help="Filter by artifact scope (vault_note, registry, rules, config). Repeatable.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format",
+)
+@click.pass_context
+def watch_events(
+    ctx: click.Context,
+    last_n: int | None,
+    event_kinds: tuple[str, ...],
+    scopes: tuple[str, ...],
+    output_format: str,
+) -> None:
+    """Read and display events from the events log.
+
+    Examples:
+
+        irrev watch events --last 10
+
+        irrev watch events --kind file_deleted --format json
+    """
+    from ..commands import run_events
+
+    count = run_events(
+        ctx.obj.vault,
+        last_n=last_n,
+        event_kinds=list(event_kinds) if event_kinds else None,
+        scopes=list(scopes) if scopes else None,
+        format=output_format,
+    )
+    ctx.exit(0 if count > 0 else 1)
+
+
+@watch.command("summary")
+@click.pass_context
+def watch_summary(ctx: click.Context) -> None:
+    """Display summary of logged events."""
+    from ..commands import run_events_summary
+
+    count = run_events_summary(ctx.obj.vault)
+    ctx.exit(0 if count > 0 else 1)
@@ -1 +1,62 @@
-"""CLI command implementations."""
+"""CLI command implementations.
+
+`run_*` entrypoints are resolved lazily (PEP 562): `from irrev.commands
+import run_lint` imports only `irrev.commands.lint`.
+"""
+
+import importlib
+
+_LAZY_ATTRS = {
+    "run_artifact_approve": "artifact_cmd",
+    "run_artifact_audit": "artifact_cmd",
+    "run_artifact_constraints": "artifact_cmd",
+    "run_artifact_execution": "artifact_cmd",
+    "run_artifact_explain": "artifact_cmd",
+    "run_artifact_list": "artifact_cmd",
+    "run_artifact_show": "artifact_cmd",
+    "run_artifact_status": "artifact_cmd",
+    "run_artifact_summary": "artifact_cmd",
+    "run_artifact_timeline": "artifact_cmd",
+    "run_artifact_type_check": "artifact_types_cmd",
+    "run_artifact_type_info": "artifact_types_cmd",
+    "run_artifact_types_list": "artifact_types_cmd",
+    "run_audit": "audit",
+    "run_communities": "graph_cmd",
+    "run_graph": "graph_cmd",
+    "run_hubs": "hubs",
+    "run_concept_audit": "junctions",
+    "run_definition_analysis": "junctions",
+    "run_domain_audit": "junctions",
+    "run_implicit_audit": "junctions",
+    "run_explain": "lint",
+    "run_explain_invariant": "lint",
+    "run_lint": "lint",
+    "run_trace": "lint",
+    "run_neo4j_export": "neo4j_cmd",
+    "run_neo4j_load": "neo4j_cmd",
+    "run_neo4j_load_from_plan_id": "neo4j_cmd",
+    "run_neo4j_load_propose": "neo4j_cmd",
+    "run_neo4j_ping": "neo4j_cmd",
+    "run_pack": "pack",
+    "run_build": "registry",
+    "run_diff": "registry",
+    "run_self_audit": "self_audit_cmd",
+    "run_events": "watch_cmd",
+    "run_events_summary": "watch_cmd",
+    "run_watch": "watch_cmd",
+}
+
+__all__ = sorted(_LAZY_ATTRS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRS})
@@ -0,0 +1,35 @@
+"""Newline-delimited JSON output for record streams.
+
+Uses `orjson` when it is installed and falls back to the stdlib `json`
+module otherwise; both produce the same compact one-record-per-line output.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def dumps_line(record: dict[str, Any]) -> bytes:
+    """Serialize one record as a UTF-8 JSON line (with trailing newline)."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def write_ndjson(records: Iterable[dict[str, Any]]) -> int:
+    """Write records to stdout as NDJSON. Returns the number written."""
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    count = 0
+    for record in records:
+        out.write(dumps_line(record))
+        count += 1
+    out.flush()
+    return count
@@ -7,6 +7,7 @@ irreversibility accounting framework vocabulary.
 from __future__ import annotations
 
 import csv
+import os
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -207,9 +208,29 @@ def _load_vault_audit(path: Path) -> list[VaultNoteRow]:
     return rows
 
 
-def load_audit_data(csv_folder: Path) -> AuditData:
-    """Load all CSV exports from a folder."""
+def _list_csv_files(csv_folder: Path) -> dict[str, str]:
+    """CSV files directly inside `csv_folder` (one directory read).
+
+    Keyed by casefolded name, mapping to the name on disk, so exports are
+    matched case-insensitively as `Path.exists()` does on Windows and macOS.
+    """
+    with os.scandir(csv_folder) as it:
+        return {
+            entry.name.casefold(): entry.name
+            for entry in it
+            if entry.name.casefold().endswith(".csv") and entry.is_file()
+        }
+
+
+def load_audit_data(csv_folder: Path, available: dict[str, str] | None = None) -> AuditData:
+    """Load all CSV exports from a folder.
+
+    `available` is the folder listing from `_list_csv_files`; it is read here
+    when not supplied.
+    """
     data = AuditData()
+    if available is None:
+        available = _list_csv_files(csv_folder)
 
     mappings = [
         ('Concept topology.csv', lambda p: setattr(data, 'concepts', _load_concept_topology(p))),
@@ -222,9 +243,9 @@ def load_audit_data(csv_folder: Path) -> AuditData:
     ]
 
     for filename, loader in mappings:
-        path = csv_folder / filename
-        if path.exists():
-            loader(path)
+        on_disk = available.get(filename.casefold())
+        if on_disk is not None:
+            loader(csv_folder / on_disk)
 
     return data
 
@@ -562,12 +583,12 @@ def run_audit(
         'Concept topology.csv',
         'Full vault audit.csv',
     ]
-    found = any((csv_folder / name).exists() for name in expected_csvs)
-    if not found:
+    available = _list_csv_files(csv_folder)
+    if not any(name.casefold() in available for name in expected_csvs):
         console.print(f"[yellow]Warning: No expected CSV files found in {csv_folder}[/yellow]")
         console.print("Expected at least one of: " + ", ".join(expected_csvs))
 
-    data = load_audit_data(csv_folder)
+    data = load_audit_data(csv_folder, available)
     report = generate_report(data)
 
     if out:
@@ -1,18 +1,33 @@
 """Lint command implementation."""
 
+from __future__ import annotations
+
 import json
+import re
 import sys
 import hashlib
 from pathlib import Path
-
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING
 
 from ..constraints import load_core_ruleset, run_constraints_lint
 from ..vault.graph import DependencyGraph
 from ..vault.loader import load_vault
 from ..vault.rules import RULE_EXPLANATIONS, LintResult, LintRules, get_rule_ids
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# The inline rich markup used in status messages ("[yellow]" / "[/]"); other
+# bracketed text such as rule IDs or "[missing]" is content and must survive.
+_MARKUP_TAG = re.compile(r"\[(?:yellow|/)\]")
+
+
+class _PlainStderr:
+    """Unstyled stand-in for a stderr Console, so `lint --json` never imports rich."""
+
+    def print(self, text: str = "", *, style: str | None = None) -> None:
+        sys.stderr.write(_MARKUP_TAG.sub("", text) + "\n")
+
 
 def run_lint(
     vault_path: Path,
@@ -37,7 +52,12 @@ def run_lint(
     Returns:
         Exit code (0 = success, 1 = failures found)
     """
-    console = Console(stderr=True)
+    if output_json:
+        console: Console | _PlainStderr = _PlainStderr()
+    else:
+        from rich.console import Console
+
+        console = Console(stderr=True)
 
     # Load vault
     console.print(f"Loading vault from {vault_path}...", style="dim")
@@ -340,6 +360,8 @@ def _print_invariant_grouped_output(
     # Print summary
     console.print()
 
+    from rich.table import Table
+
     table = Table(title="Vault Summary", show_header=False)
     table.add_column("Metric", style="cyan")
     table.add_column("Count", justify="right")
@@ -435,6 +457,8 @@ def _print_human_output(
     # Print summary
     console.print()
 
+    from rich.table import Table
+
     table = Table(title="Vault Summary", show_header=False)
     table.add_column("Metric", style="cyan")
     table.add_column("Count", justify="right")
@@ -470,6 +494,8 @@ def run_explain(rule_id: str) -> int:
     Returns:
         Exit code (0 = success, 1 = rule not found)
     """
+    from rich.console import Console
+
     console = Console()
 
     # Normalize rule_id
@@ -500,7 +526,9 @@ def run_explain_invariant(invariant_id: str) -> int:
     Returns:
         Exit code (0 = success, 1 = invariant not found)
     """
+    from rich.console import Console
     from rich.markdown import Markdown
+
     from irrev.vault.invariants import INVARIANTS
 
     console = Console()
@@ -554,6 +582,8 @@ def run_trace(vault_path: Path, note_name: str) -> int:
     Returns:
         Exit code (0 = success, 1 = note not found)
     """
+    from rich.console import Console
+
     console = Console(stderr=True)
 
     # Load vault
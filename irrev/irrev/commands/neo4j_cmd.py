@@ -3,22 +3,32 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import json
+import os
 import re
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Callable, Iterable, Iterator, TypeVar
 
 from rich.console import Console
 
-from ..neo4j.http import Neo4jHttpClient, Neo4jHttpConfig
+from ..neo4j.http import Neo4jError, Neo4jHttpClient, Neo4jHttpConfig
 from ..vault.loader import Vault, load_vault
 from ..vault.parser import extract_frontmatter_depends_on, extract_section
 from .graph_cmd import LinkGraph, _greedy_modularity_communities  # type: ignore
 
 
+_T = TypeVar("_T")
+
+# Retries for Neo.TransientError.* (e.g. deadlocks between concurrent batches).
+_TRANSIENT_RETRIES = 3
+
 _WIKILINK_OCCURRENCE_PATTERN = re.compile(r"\[\[([^\]|#]+)(?:#[^\]|]+)?(?:\|[^\]]+)?\]\]")
 
 
@@ -117,10 +127,8 @@ def _clear_edge_statements() -> list[dict[str, Any]]:
     return [{"statement": "MATCH ()-[r:LINKS_TO|DEPENDS_ON]->() DELETE r"}]
 
 
-def _upsert_notes_statement(rows: list[dict[str, Any]]) -> dict[str, Any]:
-    # Dynamic labels without APOC: FOREACH + CASE.
-    return {
-        "statement": """
+# Dynamic labels without APOC: FOREACH + CASE.
+_CYPHER_UPSERT_NOTES = """
 UNWIND $rows AS row
 MERGE (n:Note {note_id: row.note_id})
 SET
@@ -145,25 +153,22 @@ FOREACH (_ IN CASE WHEN row.label = 'Invariant' THEN [1] ELSE [] END | SET n:Inv
 FOREACH (_ IN CASE WHEN row.label = 'Meta' THEN [1] ELSE [] END | SET n:Meta)
 FOREACH (_ IN CASE WHEN row.label = 'Report' THEN [1] ELSE [] END | SET n:Report)
 FOREACH (_ IN CASE WHEN row.label = 'Support' THEN [1] ELSE [] END | SET n:Support)
-""",
-        "parameters": {"rows": rows},
-    }
+"""
 
 
-def _upsert_links_statement(edges: list[dict[str, Any]], *, rel_type: str) -> dict[str, Any]:
-    if rel_type not in ("LINKS_TO", "DEPENDS_ON"):
-        raise ValueError(f"Unsupported relationship type: {rel_type}")
+def _upsert_notes_statement(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    return {"statement": _CYPHER_UPSERT_NOTES, "parameters": {"rows": rows}}
+
 
-    if rel_type == "LINKS_TO":
-        statement = """
+_CYPHER_UPSERT_LINKS_TO = """
  UNWIND $edges AS e
  MATCH (s:Note {note_id: e.src})
  MATCH (t:Note {note_id: e.dst})
  MERGE (s)-[r:LINKS_TO]->(t)
  SET r.count = e.count, r.kinds = e.kinds
  """
-    else:
-        statement = """
+
+_CYPHER_UPSERT_DEPENDS_ON = """
  UNWIND $edges AS e
  MATCH (s:Note {note_id: e.src})
  MATCH (t:Note {note_id: e.dst})
@@ -173,12 +178,19 @@ def _upsert_links_statement(edges: list[dict[str, Any]], *, rel_type: str) -> di
    r.from_structural = coalesce(r.from_structural, false) OR coalesce(e.from_structural, false)
  """
 
+_CYPHER_UPSERT_EDGES = {"LINKS_TO": _CYPHER_UPSERT_LINKS_TO, "DEPENDS_ON": _CYPHER_UPSERT_DEPENDS_ON}
+
+
+def _upsert_links_statement(edges: list[dict[str, Any]], *, rel_type: str) -> dict[str, Any]:
+    statement = _CYPHER_UPSERT_EDGES.get(rel_type)
+    if statement is None:
+        raise ValueError(f"Unsupported relationship type: {rel_type}")
     return {"statement": statement, "parameters": {"edges": edges}}
 
 
-def _upsert_concept_topology_statement(rows: list[dict[str, Any]]) -> dict[str, Any]:
-    return {
-        "statement": """
+_CYPHER_COUNT_NODES_EDGES = "MATCH (n) RETURN count(n) as nodes UNION ALL MATCH ()-[r]->() RETURN count(r) as nodes"
+
+_CYPHER_UPSERT_CONCEPT_TOPOLOGY = """
 UNWIND $rows AS row
 MATCH (n:Note {note_id: row.note_id})
 SET
@@ -191,8 +203,90 @@ SET
   n.boundary_edges_links_greedy = row.boundary_edges_links_greedy,
   n.boundary_edges_depends_greedy = row.boundary_edges_depends_greedy,
   n.boundary_edges_both_greedy = row.boundary_edges_both_greedy
-""",
-        "parameters": {"rows": rows},
+"""
+
+
+def _upsert_concept_topology_statement(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    return {"statement": _CYPHER_UPSERT_CONCEPT_TOPOLOGY, "parameters": {"rows": rows}}
+
+
+# LOAD CSV bulk path: rows are staged as CSV files in the server's import
+# directory and parsed server-side. LOAD CSV reads an empty cell as null, so
+# every present value is written behind _CSV_VALUE_PREFIX and stripped with
+# substring(): "" round-trips as "", None (an empty cell) as null. List
+# properties are joined with the ASCII unit separator; an empty list is an
+# empty cell, coalesced back to [].
+_CSV_VALUE_PREFIX = "="
+_CSV_LIST_SEP = "\x1f"
+_CSV_NOTE_COLUMNS = (
+    "note_id", "path", "title", "folder", "role", "type", "layer", "canonical",
+    "tags", "aliases", "facets", "failure_modes", "mtime", "label",
+)
+_CSV_LIST_COLUMNS = frozenset({"tags", "aliases", "facets", "failure_modes"})
+
+
+def _csv_note_field(col: str) -> str:
+    if col == "canonical":
+        return f"  {col}: csv.{col} = 'true'"
+    if col in _CSV_LIST_COLUMNS:
+        return f"  {col}: coalesce(split(substring(csv.{col}, 1), '\\u001F'), [])"
+    return f"  {col}: substring(csv.{col}, 1)"
+
+
+_CYPHER_LOAD_CSV_NOTES = _CYPHER_UPSERT_NOTES.replace(
+    "UNWIND $rows AS row",
+    "LOAD CSV WITH HEADERS FROM $url AS csv\n"
+    "WITH {\n" + ",\n".join(_csv_note_field(c) for c in _CSV_NOTE_COLUMNS) + "\n} AS row",
+)
+_CYPHER_LOAD_CSV_EDGES = {
+    rel_type: statement.replace("UNWIND $edges AS e", "LOAD CSV WITH HEADERS FROM $url AS e")
+    for rel_type, statement in _CYPHER_UPSERT_EDGES.items()
+}
+
+
+def _csv_note_row(row: dict[str, Any]) -> list[Any]:
+    out: list[Any] = []
+    for col in _CSV_NOTE_COLUMNS:
+        value = row.get(col)
+        if col == "canonical":
+            value = "true" if value else "false"
+        elif col in _CSV_LIST_COLUMNS:
+            value = _CSV_VALUE_PREFIX + _CSV_LIST_SEP.join(value) if value else None
+        elif value is not None:
+            value = _CSV_VALUE_PREFIX + str(value)
+        out.append(value)
+    return out
+
+
+def _stage_load_csv_statements(
+    plan: "Neo4jLoadPlan",
+    stage_dir: Path,
+    *,
+    batch_size: int,
+) -> dict[str, list[dict[str, Any]]]:
+    """Write the plan as batch CSVs under `stage_dir` and build one LOAD CSV statement per file.
+
+    `stage_dir` must be a direct child of the Neo4j import directory; files are
+    addressed as `file:///<stage_dir name>/<file>`.
+    """
+    stage_dir.mkdir(parents=True, exist_ok=False)
+
+    def stage(prefix: str, columns: Iterable[str], rows: list[list[Any]], statement: str) -> list[dict[str, Any]]:
+        out = []
+        for n, i in enumerate(range(0, len(rows), batch_size)):
+            name = f"{prefix}_{n:05d}.csv"
+            _write_csv(stage_dir / name, list(columns), rows[i : i + batch_size])
+            out.append({"statement": statement, "parameters": {"url": f"file:///{stage_dir.name}/{name}"}})
+        return out
+
+    return {
+        "notes": stage("notes", _CSV_NOTE_COLUMNS, [_csv_note_row(r) for r in plan.notes], _CYPHER_LOAD_CSV_NOTES),
+        "LINKS_TO": stage(
+            "links_to", ("src", "dst"), [list(e) for e in plan.links_to], _CYPHER_LOAD_CSV_EDGES["LINKS_TO"]
+        ),
+        "DEPENDS_ON": stage(
+            "depends_on", ("src", "dst"), [list(e) for e in plan.depends_on], _CYPHER_LOAD_CSV_EDGES["DEPENDS_ON"]
+        ),
     }
 
 
@@ -404,6 +498,72 @@ def compute_neo4j_load_plan(
     )
 
 
+def _map_with_clients(
+    client: Neo4jHttpClient,
+    cfg: Neo4jHttpConfig,
+    fn: Callable[[Neo4jHttpClient, _T], None],
+    items: list[_T],
+    *,
+    concurrency: int,
+) -> None:
+    """Call `fn(client, item)` for every item, up to `concurrency` at a time.
+
+    Runs inline on `client` when concurrency is 1. Otherwise each worker thread
+    gets its own client (and kept-alive connection), closed when all items are
+    done; the first exception raised by `fn` is re-raised.
+    """
+    if concurrency <= 1 or len(items) <= 1:
+        for item in items:
+            fn(client, item)
+        return
+
+    local = threading.local()
+    clients: list[Neo4jHttpClient] = []
+    clients_lock = threading.Lock()
+
+    def submit(item: _T) -> None:
+        worker = getattr(local, "client", None)
+        if worker is None:
+            worker = local.client = Neo4jHttpClient(cfg)
+            with clients_lock:
+                clients.append(worker)
+        fn(worker, item)
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            # list() re-raises the first failure.
+            list(pool.map(submit, items))
+    finally:
+        for worker in clients:
+            worker.close()
+
+
+def _commit_batches(
+    client: Neo4jHttpClient,
+    cfg: Neo4jHttpConfig,
+    statements: list[dict[str, Any]],
+    *,
+    concurrency: int,
+) -> None:
+    """Commit one statement per transaction, up to `concurrency` in flight.
+
+    Batches that touch overlapping nodes can hit Neo4j deadlock detection when
+    run concurrently, so transient errors are retried.
+    """
+
+    def commit(worker: Neo4jHttpClient, statement: dict[str, Any]) -> None:
+        for attempt in range(_TRANSIENT_RETRIES + 1):
+            try:
+                worker.commit([statement])
+                return
+            except Neo4jError as e:
+                if not e.transient or attempt == _TRANSIENT_RETRIES:
+                    raise
+                time.sleep(0.05 * (attempt + 1))
+
+    _map_with_clients(client, cfg, commit, statements, concurrency=concurrency)
+
+
 def execute_neo4j_load_plan(
     plan: "Neo4jLoadPlan",
     *,
@@ -412,24 +572,32 @@ def execute_neo4j_load_plan(
     ensure_schema: bool,
     batch_size: int,
     console: Console,
+    concurrency: int = 1,
+    import_dir: Path | None = None,
 ) -> "Neo4jLoadResult":
     """
     Execute a neo4j load plan.
 
     This is the action phase - executes writes and returns result.
+    Batches within a phase (notes, LINKS_TO, DEPENDS_ON) are submitted up to
+    `concurrency` at a time; phases themselves run in order.
+
+    With `import_dir` (the server's import directory, on a filesystem this
+    process can write), batches are staged as CSV files and ingested with
+    LOAD CSV instead of being sent as UNWIND parameters. If staging fails the
+    load falls back to UNWIND.
     """
     from irrev.planning import Neo4jLoadResult
     from irrev.audit_log import ErasureCost, CreationSummary
 
-    client = Neo4jHttpClient(
-        Neo4jHttpConfig(
-            http_uri=plan.http_uri,
-            user=user,
-            password=password,
-            database=plan.database,
-            allow_default_db_fallback=False,
-        )
+    cfg = Neo4jHttpConfig(
+        http_uri=plan.http_uri,
+        user=user,
+        password=password,
+        database=plan.database,
+        allow_default_db_fallback=False,
     )
+    client = Neo4jHttpClient(cfg)
 
     erased = ErasureCost()
     created = CreationSummary()
@@ -438,8 +606,7 @@ def execute_neo4j_load_plan(
         if plan.mode == "rebuild":
             # Query current counts before wipe for audit
             try:
-                count_query = "MATCH (n) RETURN count(n) as nodes UNION ALL MATCH ()-[r]->() RETURN count(r) as nodes"
-                _, count_rows = client.query_rows(count_query)
+                _, count_rows = client.query_rows(_CYPHER_COUNT_NODES_EDGES)
                 if len(count_rows) >= 2:
                     erased.notes = count_rows[0][0] if count_rows[0] else 0
                     erased.edges = count_rows[1][0] if count_rows[1] else 0
@@ -468,24 +635,48 @@ def execute_neo4j_load_plan(
                 except Exception as e2:
                     console.print(f"Neo4j: schema creation skipped ({e2})", style="yellow")
 
-        console.print(f"Neo4j: upserting {len(plan.notes)} notes...", style="yellow")
-        for i in range(0, len(plan.notes), batch_size):
-            batch = plan.notes[i : i + batch_size]
-            client.commit([_upsert_notes_statement(batch)])
-
-        # Convert tuples back to dicts for the statement builders
-        links_to_dicts = [{"src": s, "dst": d} for s, d in plan.links_to]
-        depends_on_dicts = [{"src": s, "dst": d} for s, d in plan.depends_on]
+        staged: dict[str, list[dict[str, Any]]] | None = None
+        if import_dir is not None:
+            stage_dir = import_dir / f"irrev_{time.strftime('%Y%m%dT%H%M%S')}_{os.getpid()}"
+            try:
+                staged = _stage_load_csv_statements(plan, stage_dir, batch_size=batch_size)
+                console.print(f"Neo4j: staged LOAD CSV batches in {stage_dir}", style="yellow")
+            except OSError as e:
+                shutil.rmtree(stage_dir, ignore_errors=True)
+                console.print(f"Neo4j: cannot stage CSVs in {import_dir} ({e}); using UNWIND batches", style="yellow")
 
-        console.print(f"Neo4j: writing {len(links_to_dicts)} LINKS_TO edges...", style="yellow")
-        for i in range(0, len(links_to_dicts), batch_size):
-            batch = links_to_dicts[i : i + batch_size]
-            client.commit([_upsert_links_statement(batch, rel_type="LINKS_TO")])
+        try:
+            console.print(f"Neo4j: upserting {len(plan.notes)} notes...", style="yellow")
+            _commit_batches(
+                client,
+                cfg,
+                staged["notes"]
+                if staged is not None
+                else [
+                    _upsert_notes_statement(plan.notes[i : i + batch_size])
+                    for i in range(0, len(plan.notes), batch_size)
+                ],
+                concurrency=concurrency,
+            )
 
-        console.print(f"Neo4j: writing {len(depends_on_dicts)} DEPENDS_ON edges...", style="yellow")
-        for i in range(0, len(depends_on_dicts), batch_size):
-            batch = depends_on_dicts[i : i + batch_size]
-            client.commit([_upsert_links_statement(batch, rel_type="DEPENDS_ON")])
+            for rel_type, pairs in (("LINKS_TO", plan.links_to), ("DEPENDS_ON", plan.depends_on)):
+                console.print(f"Neo4j: writing {len(pairs)} {rel_type} edges...", style="yellow")
+                # Convert tuples back to dicts for the statement builders
+                edge_dicts = [{"src": s, "dst": d} for s, d in pairs] if staged is None else []
+                _commit_batches(
+                    client,
+                    cfg,
+                    staged[rel_type]
+                    if staged is not None
+                    else [
+                        _upsert_links_statement(edge_dicts[i : i + batch_size], rel_type=rel_type)
+                        for i in range(0, len(edge_dicts), batch_size)
+                    ],
+                    concurrency=concurrency,
+                )
+        finally:
+            if staged is not None:
+                shutil.rmtree(stage_dir, ignore_errors=True)
 
         console.print("Neo4j: writing derived concept topology properties (communities/bridges)...", style="yellow")
         client.commit([_upsert_concept_topology_statement(plan.topology_rows)])
@@ -508,6 +699,8 @@ def execute_neo4j_load_plan(
             success=False,
             error=str(e),
         )
+    finally:
+        client.close()
 
 
 def run_neo4j_load(
@@ -521,6 +714,8 @@ def run_neo4j_load(
     ensure_schema: bool,
     batch_size: int,
     dry_run: bool = False,
+    concurrency: int = 1,
+    import_dir: Path | None = None,
 ) -> int:
     """
     Load the vault into Neo4j.
@@ -551,8 +746,7 @@ def run_neo4j_load(
                     allow_default_db_fallback=False,
                 )
             )
-            count_query = "MATCH (n) RETURN count(n) as nodes UNION ALL MATCH ()-[r]->() RETURN count(r) as nodes"
-            _, count_rows = client.query_rows(count_query)
+            _, count_rows = client.query_rows(_CYPHER_COUNT_NODES_EDGES)
             if len(count_rows) >= 2:
                 plan.existing_node_count = count_rows[0][0] if count_rows[0] else 0
                 plan.existing_edge_count = count_rows[1][0] if count_rows[1] else 0
@@ -573,6 +767,8 @@ def run_neo4j_load(
         ensure_schema=ensure_schema,
         batch_size=batch_size,
         console=console,
+        concurrency=concurrency,
+        import_dir=import_dir,
     )
 
     if not result.success:
@@ -665,8 +861,14 @@ def run_neo4j_load_from_plan_id(
     batch_size: int,
     user: str,
     password: str,
+    concurrency: int = 1,
+    import_dir: Path | None = None,
 ) -> int:
-    """Execute an approved Neo4j load plan artifact."""
+    """Execute an approved Neo4j load plan artifact.
+
+    `concurrency` and `import_dir` only choose how the approved plan is
+    submitted (see `execute_neo4j_load_plan`); they are not part of the plan.
+    """
     from ..artifact.plan_manager import PlanManager
     from ..audit_log import log_operation
 
@@ -724,6 +926,8 @@ def run_neo4j_load_from_plan_id(
             ensure_schema=plan_ensure_schema,
             batch_size=plan_batch_size,
             console=console,
+            concurrency=concurrency,
+            import_dir=import_dir,
         )
 
         if not result.success:
@@ -816,13 +1020,64 @@ def _resolve_out_dir(vault_path: Path, out_dir: Path) -> Path:
     return out_dir if out_dir.is_absolute() else (vault_path / out_dir)
 
 
-def _write_csv(path: Path, columns: list[str], rows: list[list[Any]]) -> None:
+def _open_export(path: Path, compress: bool) -> IO[str]:
+    """Open an export file for text writing; `compress` writes `<name>.gz` at gzip level 1."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as f:
+    if compress:
+        # Level 1 is near memory bandwidth and still roughly halves CSV/JSON size.
+        return gzip.open(path.with_name(path.name + ".gz"), "wt", compresslevel=1, encoding="utf-8", newline="")
+    return path.open("w", encoding="utf-8", newline="", buffering=1 << 20)
+
+
+def _write_csv(path: Path, columns: list[str], rows: Iterable[list[Any]], *, compress: bool = False) -> None:
+    with _open_export(path, compress) as f:
         w = csv.writer(f)
         w.writerow(columns)
-        for r in rows:
-            w.writerow(r)
+        w.writerows(rows)
+
+
+def _query_pages(
+    client: Neo4jHttpClient,
+    query: str,
+    *,
+    page_size: int,
+    parameters: dict[str, Any] | None = None,
+) -> Iterator[list[Any]]:
+    """Yield rows of a `SKIP $offset LIMIT $page` query one page at a time."""
+    offset = 0
+    while True:
+        _, rows = client.query_rows(query, parameters={**(parameters or {}), "offset": offset, "page": page_size})
+        yield from rows
+        if len(rows) < page_size:
+            return
+        offset += page_size
+
+
+def _write_json(path: Path, obj: Any, *, compress: bool = False) -> None:
+    # json.dump streams encoder chunks to the file instead of building one string.
+    with _open_export(path, compress) as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+
+
+def _write_json_arrays(f: IO[str], arrays: Iterable[tuple[str, Iterable[Any]]]) -> None:
+    """Write `{key: [item, ...], ...}` to `f` one item at a time.
+
+    The output is byte-identical to `json.dump(obj, f, ensure_ascii=False, indent=2)`
+    on the equivalent dict, but the arrays are never held in memory.
+    """
+    f.write("{")
+    wrote_key = False
+    for key, items in arrays:
+        f.write(",\n  " if wrote_key else "\n  ")
+        wrote_key = True
+        f.write(json.dumps(key, ensure_ascii=False) + ": [")
+        empty = True
+        for item in items:
+            f.write("\n    " if empty else ",\n    ")
+            empty = False
+            f.write(json.dumps(item, ensure_ascii=False, indent=2).replace("\n", "\n    "))
+        f.write("]" if empty else "\n  ]")
+    f.write("\n}" if wrote_key else "}")
 
 
 def run_neo4j_export(
@@ -842,10 +1097,15 @@ def run_neo4j_export(
     token_min_df: int,
     token_max_df: int,
     token_top_per_concept: int,
+    page_size: int = 10_000,
+    compress: bool = False,
+    concurrency: int = 1,
 ) -> int:
     """Export a bundle of inspection artifacts (CSV/JSON) from Neo4j.
 
     Convenience wrapper around the manual query pack in `content/meta/graphs/Neo4j Manual Queries.md`.
+    With `compress`, every file is written gzip'd as `<name>.gz`. The
+    independent top-N queries run up to `concurrency` at a time.
     """
     console = Console(stderr=True)
 
@@ -854,14 +1114,16 @@ def run_neo4j_export(
         out_base = out_base / date.today().isoformat()
     out_base.mkdir(parents=True, exist_ok=True)
 
-    client = Neo4jHttpClient(
-        Neo4jHttpConfig(http_uri=http_uri, user=user, password=password, database=database, allow_default_db_fallback=False)
+    cfg = Neo4jHttpConfig(
+        http_uri=http_uri, user=user, password=password, database=database, allow_default_db_fallback=False
     )
+    client = Neo4jHttpClient(cfg)
 
     # Clamp to match MCP row limits.
     top = max(1, min(500, int(top)))
 
     try:
+        # Queries 1-8 are independent: run them concurrently, each writing its own CSV.
         # 1) Counts
         q_counts = (
             "MATCH (n:Note) "
@@ -872,28 +1134,22 @@ def run_neo4j_export(
             "RETURN notes, link_edges, link_occurrences, count(1) AS depends_edges "
             "LIMIT 1"
         )
-        cols, rows = client.query_rows(q_counts)
-        _write_csv(out_base / "1_counts.csv", cols, rows)
 
         # 2) Top inbound hubs (LINKS_TO occurrences)
         q_inlinks = (
             "MATCH (s:Note)-[r:LINKS_TO]->(t:Note) "
             "RETURN t.note_id, t.title, sum(r.count) AS inlink_occurrences "
             "ORDER BY inlink_occurrences DESC, t.note_id ASC "
-            f"LIMIT {top}"
+            "LIMIT $top"
         )
-        cols, rows = client.query_rows(q_inlinks)
-        _write_csv(out_base / "2_top_inlinks.csv", cols, rows)
 
         # 3) Top “requirements hubs” (incoming DEPENDS_ON)
         q_in_dep = (
             "MATCH (:Note)-[:DEPENDS_ON]->(t:Note:Concept) "
             "RETURN t.note_id, t.title, count(1) AS in_depends "
             "ORDER BY in_depends DESC, t.note_id ASC "
-            f"LIMIT {top}"
+            "LIMIT $top"
         )
-        cols, rows = client.query_rows(q_in_dep)
-        _write_csv(out_base / "3_top_in_depends.csv", cols, rows)
 
         # 4) Mentions without requirements (concept→concept links without DEPENDS_ON)
         q_mentions_without = (
@@ -903,8 +1159,6 @@ def run_neo4j_export(
             "ORDER BY src ASC, dst ASC "
             "LIMIT 500"
         )
-        cols, rows = client.query_rows(q_mentions_without)
-        _write_csv(out_base / "4_mentions_without_depends.csv", cols, rows)
 
         # 5) Requirements without mentions
         q_dep_without_mentions = (
@@ -914,8 +1168,6 @@ def run_neo4j_export(
             "ORDER BY src ASC, dst ASC "
             "LIMIT 500"
         )
-        cols, rows = client.query_rows(q_dep_without_mentions)
-        _write_csv(out_base / "5_depends_without_mentions.csv", cols, rows)
 
         # 6) Touch vs require for a specific concept (two CSVs)
         q_touch = (
@@ -924,8 +1176,6 @@ def run_neo4j_export(
             "ORDER BY r.count DESC, t.note_id ASC "
             "LIMIT 500"
         )
-        cols, rows = client.query_rows(q_touch, parameters={"note_id": concept_note_id})
-        _write_csv(out_base / "6_touch_links_to_concepts.csv", cols, rows)
 
         q_req = (
             "MATCH (c:Note:Concept {note_id: $note_id})-[r:DEPENDS_ON]->(t:Note:Concept) "
@@ -933,8 +1183,6 @@ def run_neo4j_export(
             "ORDER BY t.note_id ASC "
             "LIMIT 500"
         )
-        cols, rows = client.query_rows(q_req, parameters={"note_id": concept_note_id})
-        _write_csv(out_base / "7_requires_depends_on.csv", cols, rows)
 
         # 7) Community summary + bridge nodes (links topology)
         q_comm = (
@@ -946,8 +1194,6 @@ def run_neo4j_export(
             "ORDER BY nodes DESC, community ASC "
             "LIMIT 50"
         )
-        cols, rows = client.query_rows(q_comm)
-        _write_csv(out_base / "8_communities_links.csv", cols, rows)
 
         q_bridge = (
             "MATCH (n:Note:Concept) "
@@ -955,10 +1201,8 @@ def run_neo4j_export(
             "RETURN n.note_id, n.title, n.layer, n.community_links_greedy AS community, "
             "n.bridge_links_greedy AS bridge, n.boundary_edges_links_greedy AS boundary_edges "
             "ORDER BY boundary_edges DESC, bridge DESC, n.note_id ASC "
-            f"LIMIT {top}"
+            "LIMIT $top"
         )
-        cols, rows = client.query_rows(q_bridge)
-        _write_csv(out_base / "9_bridge_nodes_links.csv", cols, rows)
 
         # 8) Projection subgraphs: projection → community counts (links)
         q_proj_comm = (
@@ -969,59 +1213,93 @@ def run_neo4j_export(
             "ORDER BY p.note_id ASC, n DESC, community ASC "
             "LIMIT 500"
         )
-        cols, rows = client.query_rows(q_proj_comm)
-        _write_csv(out_base / "10_projection_community_counts.csv", cols, rows)
-
-        # 9) Export concept-only two-layer graph (nodes/edges CSV + JSON)
-        q_graph = """
-MATCH (n:Note:Concept)
-WITH collect({
-  id: n.note_id,
-  label: n.title,
-  role: n.role,
-  layer: n.layer,
-  community: n.community_links_greedy
-}) AS nodes
-MATCH (s:Note:Concept)-[r:LINKS_TO]->(t:Note:Concept)
-WITH nodes, collect({
-  source: s.note_id,
-  target: t.note_id,
-  type: "LINKS_TO",
-  weight: r.count
-}) AS links
-MATCH (s:Note:Concept)-[d:DEPENDS_ON]->(t:Note:Concept)
-WITH nodes, links, collect({
-  source: s.note_id,
-  target: t.note_id,
-  type: "DEPENDS_ON",
-  weight: 1,
-  from_frontmatter: d.from_frontmatter,
-  from_structural: d.from_structural
-}) AS dep_links
-WITH nodes, links + dep_links AS links
-RETURN {nodes: nodes, links: links} AS graph
-LIMIT 1
-"""
-        _, graph_rows = client.query_rows(q_graph)
-        graph_obj: dict[str, Any] = {}
-        if graph_rows and graph_rows[0] and isinstance(graph_rows[0][0], dict):
-            graph_obj = graph_rows[0][0]
-
-        (out_base / "11_two_layer_graph.json").write_text(
-            json.dumps(graph_obj, ensure_ascii=False, indent=2),
-            encoding="utf-8",
+
+        export_jobs: list[tuple[str, str, dict[str, Any] | None]] = [
+            ("1_counts.csv", q_counts, None),
+            ("2_top_inlinks.csv", q_inlinks, {"top": top}),
+            ("3_top_in_depends.csv", q_in_dep, {"top": top}),
+            ("4_mentions_without_depends.csv", q_mentions_without, None),
+            ("5_depends_without_mentions.csv", q_dep_without_mentions, None),
+            ("6_touch_links_to_concepts.csv", q_touch, {"note_id": concept_note_id}),
+            ("7_requires_depends_on.csv", q_req, {"note_id": concept_note_id}),
+            ("8_communities_links.csv", q_comm, None),
+            ("9_bridge_nodes_links.csv", q_bridge, {"top": top}),
+            ("10_projection_community_counts.csv", q_proj_comm, None),
+        ]
+
+        def export_one(worker: Neo4jHttpClient, job: tuple[str, str, dict[str, Any] | None]) -> None:
+            filename, query, parameters = job
+            cols, rows = worker.query_rows(query, parameters=parameters)
+            _write_csv(out_base / filename, cols, rows, compress=compress)
+
+        _map_with_clients(client, cfg, export_one, export_jobs, concurrency=concurrency)
+
+        # 9) Export concept-only two-layer graph (nodes/edges CSV + JSON).
+        # Paged by note_id so the server never materializes the whole graph in one row.
+        q_graph_nodes = (
+            "MATCH (n:Note:Concept) "
+            "RETURN n.note_id, n.title, n.role, n.layer, n.community_links_greedy "
+            "ORDER BY n.note_id "
+            "SKIP $offset LIMIT $page"
+        )
+        q_graph_links = (
+            "MATCH (s:Note:Concept)-[r:LINKS_TO]->(t:Note:Concept) "
+            "RETURN s.note_id, t.note_id, r.count "
+            "ORDER BY s.note_id, t.note_id "
+            "SKIP $offset LIMIT $page"
         )
+        q_graph_depends = (
+            "MATCH (s:Note:Concept)-[d:DEPENDS_ON]->(t:Note:Concept) "
+            "RETURN s.note_id, t.note_id, d.from_frontmatter, d.from_structural "
+            "ORDER BY s.note_id, t.note_id "
+            "SKIP $offset LIMIT $page"
+        )
+        # Streamed page by page into the JSON and both CSVs, so the graph is never held in memory.
+        node_cols = ["id", "label", "role", "layer", "community"]
+        edge_cols = ["source", "target", "type", "weight", "from_frontmatter", "from_structural"]
+        # Edge pairs are only kept when the vault-side exports below need them.
+        track_edges = include_mentions or include_ghost_terms or include_definition_tokens
+        existing_links: set[tuple[str, str]] = set()
+        existing_depends: set[tuple[str, str]] = set()
+
+        with (
+            _open_export(out_base / "11_two_layer_graph.json", compress) as graph_f,
+            _open_export(out_base / "11_two_layer_nodes.csv", compress) as nodes_f,
+            _open_export(out_base / "11_two_layer_edges.csv", compress) as edges_f,
+        ):
+            nodes_w = csv.writer(nodes_f)
+            nodes_w.writerow(node_cols)
+            edges_w = csv.writer(edges_f)
+            edges_w.writerow(edge_cols)
+
+            def graph_nodes() -> Iterator[dict[str, Any]]:
+                for nid, title, role, layer, community in _query_pages(client, q_graph_nodes, page_size=page_size):
+                    node = {"id": nid, "label": title, "role": role, "layer": layer, "community": community}
+                    nodes_w.writerow([node[c] for c in node_cols])
+                    yield node
+
+            def graph_links() -> Iterator[dict[str, Any]]:
+                for src, dst, count in _query_pages(client, q_graph_links, page_size=page_size):
+                    edges_w.writerow([src, dst, "LINKS_TO", count, None, None])
+                    if track_edges and isinstance(src, str) and isinstance(dst, str):
+                        existing_links.add((src, dst))
+                    yield {"source": src, "target": dst, "type": "LINKS_TO", "weight": count}
+                for src, dst, from_frontmatter, from_structural in _query_pages(
+                    client, q_graph_depends, page_size=page_size
+                ):
+                    edges_w.writerow([src, dst, "DEPENDS_ON", 1, from_frontmatter, from_structural])
+                    if track_edges and isinstance(src, str) and isinstance(dst, str):
+                        existing_depends.add((src, dst))
+                    yield {
+                        "source": src,
+                        "target": dst,
+                        "type": "DEPENDS_ON",
+                        "weight": 1,
+                        "from_frontmatter": from_frontmatter,
+                        "from_structural": from_structural,
+                    }
 
-        nodes = graph_obj.get("nodes") if isinstance(graph_obj, dict) else None
-        links = graph_obj.get("links") if isinstance(graph_obj, dict) else None
-        if isinstance(nodes, list):
-            node_cols = ["id", "label", "role", "layer", "community"]
-            node_rows = [[n.get(c) for c in node_cols] for n in nodes if isinstance(n, dict)]
-            _write_csv(out_base / "11_two_layer_nodes.csv", node_cols, node_rows)
-        if isinstance(links, list):
-            edge_cols = ["source", "target", "type", "weight", "from_frontmatter", "from_structural"]
-            edge_rows = [[e.get(c) for c in edge_cols] for e in links if isinstance(e, dict)]
-            _write_csv(out_base / "11_two_layer_edges.csv", edge_cols, edge_rows)
+            _write_json_arrays(graph_f, [("nodes", graph_nodes()), ("links", graph_links())])
 
         if include_mentions or include_ghost_terms or include_definition_tokens:
             vault = load_vault(vault_path)
@@ -1037,21 +1315,7 @@ LIMIT 1
 
             concept_by_name: dict[str, Any] = {c.name.lower(): c for c in concepts}
 
-            # Existing structural edges/links from Neo4j export graph.
-            existing_links: set[tuple[str, str]] = set()
-            existing_depends: set[tuple[str, str]] = set()
-            if isinstance(links, list):
-                for e in links:
-                    if not isinstance(e, dict):
-                        continue
-                    s = e.get("source")
-                    t = e.get("target")
-                    typ = e.get("type")
-                    if isinstance(s, str) and isinstance(t, str):
-                        if typ == "LINKS_TO":
-                            existing_links.add((s, t))
-                        elif typ == "DEPENDS_ON":
-                            existing_depends.add((s, t))
+            # existing_links / existing_depends were collected while streaming the graph above.
 
             def _variant_patterns_for_target(target_concept) -> list[re.Pattern[str]]:
                 variants: set[str] = set()
@@ -1329,6 +1593,7 @@ LIMIT 1
                     out_base / "12_mentions_unlinked_definition.csv",
                     ["source", "source_title", "target", "target_title", "count_in_definition", "has_depends_on"],
                     mention_rows,
+                    compress=compress,
                 )
 
             if include_ghost_terms:
@@ -1336,6 +1601,7 @@ LIMIT 1
                     out_base / "12_ghost_terms_definition.csv",
                     ["source", "source_title", "ghost_id", "term", "count_in_definition"],
                     ghost_rows,
+                    compress=compress,
                 )
 
             if include_definition_tokens:
@@ -1343,6 +1609,7 @@ LIMIT 1
                     out_base / "13_definition_tokens.csv",
                     ["source", "source_title", "token_id", "token", "tf_in_definition", "df_across_concepts", "score"],
                     token_rows,
+                    compress=compress,
                 )
 
             # Optional graph JSON for the d3 viewer (adds ghost nodes + mention edges + token nodes).
@@ -1360,19 +1627,13 @@ LIMIT 1
                     g_mentions["links"] = list(g_mentions["links"]) + mention_links
 
                 if include_mentions or include_ghost_terms:
-                    (out_base / "12_mentions_graph.json").write_text(
-                        json.dumps(g_mentions, ensure_ascii=False, indent=2),
-                        encoding="utf-8",
-                    )
+                    _write_json(out_base / "12_mentions_graph.json", g_mentions, compress=compress)
 
                 if include_definition_tokens:
                     g_tokens = {"nodes": list(g_mentions["nodes"]), "links": list(g_mentions["links"])}
                     g_tokens["nodes"] = list(g_tokens["nodes"]) + list(token_nodes.values())
                     g_tokens["links"] = list(g_tokens["links"]) + token_links
-                    (out_base / "13_definition_tokens_graph.json").write_text(
-                        json.dumps(g_tokens, ensure_ascii=False, indent=2),
-                        encoding="utf-8",
-                    )
+                    _write_json(out_base / "13_definition_tokens_graph.json", g_tokens, compress=compress)
 
     except Exception as e:
         console.print(str(e), style="red")
@@ -1381,7 +1642,7 @@ LIMIT 1
     # Audit log: count files written
     from irrev.audit_log import log_operation, CreationSummary
 
-    files_written = len(list(out_base.glob("*.csv"))) + len(list(out_base.glob("*.json")))
+    files_written = sum(1 for f in out_base.iterdir() if {".csv", ".json"} & set(f.suffixes))
     bytes_written = sum(f.stat().st_size for f in out_base.iterdir() if f.is_file())
 
     log_operation(
@@ -1394,6 +1655,7 @@ LIMIT 1
             "include_mentions": include_mentions,
             "include_ghost_terms": include_ghost_terms,
             "include_definition_tokens": include_definition_tokens,
+            "compress": compress,
         },
     )
 
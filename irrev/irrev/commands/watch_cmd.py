@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
@@ -12,7 +13,9 @@ from rich.table import Table
 
 from ..events import (
     ArtifactScope,
+    EventEnvelope,
     EventKind,
+    iter_events_log,
     read_events_log,
     format_event,
 )
@@ -120,10 +123,9 @@ def run_events(
         return 0
 
     if format == "json":
-        import json
+        from ._ndjson import write_ndjson
 
-        for event in events:
-            console.print(json.dumps(event.to_dict()))
+        write_ndjson(event.to_dict() for event in events)
     else:
         # Text format
         for event in events:
@@ -141,29 +143,34 @@ def run_events_summary(vault_path: Path) -> int:
     """
     console = Console()
 
-    events = read_events_log(vault_path=vault_path)
-
-    if not events:
-        console.print("[dim]No events logged yet.[/dim]")
-        return 0
-
-    # Count by kind
-    kind_counts: dict[EventKind, int] = {}
-    scope_counts: dict[ArtifactScope, int] = {}
+    # Single streaming pass; the log is never held in memory
+    kind_counts: Counter[EventKind] = Counter()
+    scope_counts: Counter[ArtifactScope] = Counter()
     erasure_bytes = 0
-
-    for event in events:
-        kind_counts[event.event_kind] = kind_counts.get(event.event_kind, 0) + 1
-        scope_counts[event.scope] = scope_counts.get(event.scope, 0) + 1
+    total = 0
+    first: EventEnvelope | None = None
+    last: EventEnvelope | None = None
+
+    for event in iter_events_log(vault_path):
+        if first is None:
+            first = event
+        last = event
+        total += 1
+        kind_counts[event.event_kind] += 1
+        scope_counts[event.scope] += 1
         if event.erasure:
             erasure_bytes += event.erasure.bytes_erased
 
+    if first is None or last is None:
+        console.print("[dim]No events logged yet.[/dim]")
+        return 0
+
     # Display summary
     table = Table(title="Event Summary")
     table.add_column("Metric", style="bold")
     table.add_column("Value", justify="right")
 
-    table.add_row("Total events", str(len(events)))
+    table.add_row("Total events", str(total))
     table.add_row("", "")
 
     # By kind
@@ -191,13 +198,10 @@ def run_events_summary(vault_path: Path) -> int:
         table.add_row("Total bytes erased", f"{erasure_bytes:,}")
 
     # Time range
-    if events:
-        first = events[0].timestamp[:19].replace("T", " ")
-        last = events[-1].timestamp[:19].replace("T", " ")
-        table.add_row("", "")
-        table.add_row("First event", first)
-        table.add_row("Last event", last)
+    table.add_row("", "")
+    table.add_row("First event", first.timestamp[:19].replace("T", " "))
+    table.add_row("Last event", last.timestamp[:19].replace("T", " "))
 
     console.print(table)
 
-    return len(events)
+    return total
@@ -11,11 +11,14 @@ This module provides:
 
 import hashlib
 import json
+import os
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+from ._jsonl import iter_lines_reversed
 
 
 class EventKind(str, Enum):
@@ -155,8 +158,9 @@ def classify_scope(path: Path, vault_path: Path) -> ArtifactScope:
 def compute_file_hash(path: Path) -> str | None:
     """Compute SHA-256 hash of file contents."""
     try:
-        content = path.read_bytes()
-        return hashlib.sha256(content).hexdigest()[:16]  # First 16 chars
+        # file_digest streams into a reusable buffer and hashes without the GIL.
+        with path.open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()[:16]  # First 16 chars
     except (OSError, IOError):
         return None
 
@@ -189,7 +193,7 @@ def ensure_events_dir(vault_path: Path) -> Path:
     return log_path
 
 
-def log_event(
+def build_event(
     vault_path: Path,
     event_kind: EventKind,
     file_path: Path,
@@ -199,9 +203,10 @@ def log_event(
     erasure: ErasureFields | None = None,
     rename_from: str | None = None,
     metadata: dict[str, Any] | None = None,
+    file_hash: str | None = None,
 ) -> EventEnvelope:
     """
-    Log a file system event.
+    Build a file system event envelope without writing it.
 
     Args:
         vault_path: Path to the vault content directory
@@ -213,6 +218,7 @@ def log_event(
         erasure: Erasure accounting fields (for deletions)
         rename_from: Original path (for renames)
         metadata: Additional context
+        file_hash: Precomputed content hash, reused instead of rehashing
 
     Returns:
         The created event envelope
@@ -226,8 +232,9 @@ def log_event(
     except OSError:
         size = 0
 
-    file_hash = None
-    if include_hash and file_path.exists():
+    if not include_hash:
+        file_hash = None
+    elif file_hash is None and file_path.exists():
         file_hash = compute_file_hash(file_path)
 
     role, layer = None, None
@@ -252,15 +259,174 @@ def log_event(
         metadata=metadata or {},
     )
 
-    log_path = ensure_events_dir(vault_path)
+    return envelope
+
+
+# Upper bound on buffers passed to one writev call (POSIX IOV_MAX floor).
+_WRITEV_MAX_BUFFERS = 1024
+
+# Flags for appending one batch. The log is opened per batch, so a rotated or
+# deleted log is recreated rather than written to through a stale descriptor.
+_APPEND_FLAGS = (
+    os.O_WRONLY
+    | os.O_APPEND
+    | os.O_CREAT
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_BINARY", 0)
+)
+
+
+class EventLogWriter:
+    """
+    Append-only writer for the events log.
+
+    Each `append` opens the log with O_APPEND, writes the whole batch with one
+    vectored write and closes it again, so a log rotated or deleted during a
+    long-running watch is recreated instead of silently losing events.
+    """
+
+    def __init__(self, vault_path: Path):
+        self._vault_path: Path | None = vault_path
+
+    def append(self, envelopes: list[EventEnvelope]) -> None:
+        """Append envelopes as JSON Lines."""
+        if self._vault_path is None:
+            raise ValueError("events log writer is closed")
+        lines = [(json.dumps(e.to_dict()) + "\n").encode("utf-8") for e in envelopes]
+        if not lines:
+            return
+        fd = os.open(ensure_events_dir(self._vault_path), _APPEND_FLAGS, 0o644)
+        try:
+            written = 0
+            if hasattr(os, "writev") and len(lines) <= _WRITEV_MAX_BUFFERS:
+                written = os.writev(fd, lines)
+            # Finish a short (or skipped) vectored write with plain writes.
+            rest = memoryview(b"".join(lines))[written:]
+            while rest:
+                rest = rest[os.write(fd, rest) :]
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        self._vault_path = None
+
+    def __enter__(self) -> "EventLogWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def append_events(vault_path: Path, envelopes: list[EventEnvelope]) -> None:
+    """Append envelopes to the events log as JSON Lines in a single write."""
+    if not envelopes:
+        return
+    with EventLogWriter(vault_path) as writer:
+        writer.append(envelopes)
+
+
+def log_event(
+    vault_path: Path,
+    event_kind: EventKind,
+    file_path: Path,
+    scope: ArtifactScope | None = None,
+    include_hash: bool = False,
+    include_frontmatter: bool = False,
+    erasure: ErasureFields | None = None,
+    rename_from: str | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> EventEnvelope:
+    """
+    Log a file system event.
+
+    Args:
+        vault_path: Path to the vault content directory
+        event_kind: Type of event (created, modified, deleted, renamed)
+        file_path: Path to the affected file
+        scope: Classification of artifact (auto-detected if None)
+        include_hash: Whether to compute and include file hash
+        include_frontmatter: Whether to extract frontmatter summary
+        erasure: Erasure accounting fields (for deletions)
+        rename_from: Original path (for renames)
+        metadata: Additional context
+
+    Returns:
+        The created event envelope
+    """
+    envelope = build_event(
+        vault_path,
+        event_kind,
+        file_path,
+        scope=scope,
+        include_hash=include_hash,
+        include_frontmatter=include_frontmatter,
+        erasure=erasure,
+        rename_from=rename_from,
+        metadata=metadata,
+    )
+    append_events(vault_path, [envelope])
+    return envelope
 
-    # Append as JSON Lines format
-    with log_path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(envelope.to_dict()) + "\n")
 
+def _parse_envelope(
+    line: bytes | str,
+    event_kinds: list[EventKind] | None,
+    scopes: list[ArtifactScope] | None,
+) -> EventEnvelope | None:
+    """Parse one JSON Lines record, returning None for blank, malformed or filtered-out lines."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        envelope = EventEnvelope.from_dict(json.loads(line))
+    except (json.JSONDecodeError, KeyError, ValueError):
+        return None  # Skip malformed lines
+    if event_kinds and envelope.event_kind not in event_kinds:
+        return None
+    if scopes and envelope.scope not in scopes:
+        return None
     return envelope
 
 
+def _read_events_tail(
+    log_path: Path,
+    last_n: int,
+    event_kinds: list[EventKind] | None,
+    scopes: list[ArtifactScope] | None,
+) -> list[EventEnvelope]:
+    """Read the last `last_n` matching events, scanning backwards from EOF."""
+    tail: list[EventEnvelope] = []
+    for line in iter_lines_reversed(log_path):
+        envelope = _parse_envelope(line, event_kinds, scopes)
+        if envelope is not None:
+            tail.append(envelope)
+            if len(tail) >= last_n:
+                break
+    tail.reverse()
+    return tail
+
+
+def iter_events_log(
+    vault_path: Path,
+    event_kinds: list[EventKind] | None = None,
+    scopes: list[ArtifactScope] | None = None,
+) -> Iterator[EventEnvelope]:
+    """
+    Lazily yield events from the events log, oldest first.
+
+    Memory use is constant regardless of log size; malformed lines are skipped.
+    """
+    log_path = get_events_log_path(vault_path)
+    if not log_path.exists():
+        return
+
+    with log_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            envelope = _parse_envelope(line, event_kinds, scopes)
+            if envelope is not None:
+                yield envelope
+
+
 def read_events_log(
     vault_path: Path,
     last_n: int | None = None,
@@ -283,26 +449,10 @@ def read_events_log(
     if not log_path.exists():
         return []
 
-    entries = []
-    with log_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-                envelope = EventEnvelope.from_dict(data)
-
-                # Apply filters
-                if event_kinds and envelope.event_kind not in event_kinds:
-                    continue
-                if scopes and envelope.scope not in scopes:
-                    continue
-
-                entries.append(envelope)
-            except (json.JSONDecodeError, KeyError, ValueError):
-                continue  # Skip malformed lines
+    if last_n is not None and last_n > 0:
+        return _read_events_tail(log_path, last_n, event_kinds, scopes)
 
+    entries = list(iter_events_log(vault_path, event_kinds=event_kinds, scopes=scopes))
     if last_n is not None:
         return entries[-last_n:]
     return entries
@@ -12,15 +12,31 @@ Handlers are registered automatically when imported.
 
 from __future__ import annotations
 
+import threading
+
 from .neo4j_handler import Neo4jLoadHandler
 
 __all__ = [
     "Neo4jLoadHandler",
 ]
 
+# Handler instances, built on the first register_all() call.
+_HANDLERS: tuple[Neo4jLoadHandler, ...] | None = None
+_REGISTER_LOCK = threading.Lock()
 
-def register_all() -> None:
-    """Register all handlers with the registry."""
-    from ..registry import register_handler
 
-    register_handler(Neo4jLoadHandler())
+def register_all() -> None:
+    """Register all handlers with the registry.
+
+    Idempotent: handlers are instantiated once, and only re-registered if the
+    registry no longer holds them (e.g. after `clear_handlers()`).
+    """
+    global _HANDLERS
+    from ..registry import get_handler, register_handler
+
+    with _REGISTER_LOCK:
+        if _HANDLERS is None:
+            _HANDLERS = (Neo4jLoadHandler(),)
+        for handler in _HANDLERS:
+            if get_handler(handler.metadata.operation) is not handler:
+                register_handler(handler)
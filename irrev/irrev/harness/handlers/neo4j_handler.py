@@ -17,6 +17,7 @@ from typing import Any
 from rich.console import Console
 
 from ...commands.neo4j_cmd import compute_neo4j_load_plan, execute_neo4j_load_plan
+from ...neo4j import DEFAULT_BATCH_SIZE
 from ...planning import Neo4jLoadPlan, Neo4jLoadResult
 from ..handler import EffectSummary, ExecutionContext, Handler, HandlerMetadata
 from ..secrets import resolve_secrets
@@ -192,7 +193,7 @@ class Neo4jLoadHandler(Handler[Neo4jLoadPlanWithEffects, Neo4jLoadResult]):
 
         # Get optional params with defaults
         ensure_schema = True
-        batch_size = 500
+        batch_size = DEFAULT_BATCH_SIZE
 
         return execute_neo4j_load_plan(
             plan.inner,
@@ -22,7 +22,6 @@ from typing import Any
 
 from rich.console import Console
 
-from ..artifact.content_store import ContentStore
 from ..artifact.events import ARTIFACT_CREATED, ARTIFACT_REJECTED, create_event
 from ..artifact.ledger import ArtifactLedger
 from ..artifact.plan_manager import ApprovalPolicy, PlanManager
@@ -148,7 +147,8 @@ class Harness:
         self.vault_path = vault_path.resolve()
         self.irrev_dir = self.vault_path.parent / ".irrev"
         self.plan_manager = PlanManager(vault_path, policy=policy)
-        self.content_store = ContentStore(self.irrev_dir)
+        # Share the plan manager's store rather than opening a second one
+        self.content_store = self.plan_manager.content_store
         self.ledger = ArtifactLedger(self.irrev_dir)
         self.console = console or Console(stderr=True)
         self.secrets_provider = secrets_provider or CompositeSecretsProvider()
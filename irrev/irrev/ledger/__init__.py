@@ -18,13 +18,31 @@ Design principles:
 - Non-prescriptive: surfaces what happened, not what should happen
 """
 
-from .event_types import ChangeEvent, ChangeType
-from .classifier import classify_change
-from .ledger import ChangeAccountingLedger
+import importlib
+
+# Public name -> submodule. Resolved lazily (PEP 562) so `changes show` does
+# not compile the classifier's patterns.
+_LAZY_ATTRS = {
+    "ChangeEvent": "event_types",
+    "ChangeType": "event_types",
+    "classify_change": "classifier",
+    "classify_many": "classifier",
+    "ChangeAccountingLedger": "ledger",
+}
 
 __all__ = [
     "ChangeEvent",
     "ChangeType",
     "classify_change",
+    "classify_many",
     "ChangeAccountingLedger",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
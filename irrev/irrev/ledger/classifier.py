@@ -34,30 +34,34 @@ def _extract_frontmatter(content: str) -> dict:
         return {}
 
 
+_SECTION_PATTERN = re.compile(r"^## (.+)$", re.M)
+_LINK_PATTERN = re.compile(r"\[\[([^\]|#]+)")
+
+_DEPS_MARKER = "## structural dependencies"
+
+
 def _extract_sections(content: str) -> set[str]:
     """Extract ## headings from markdown."""
-    return set(re.findall(r"^## (.+)$", content, re.M))
+    return set(_SECTION_PATTERN.findall(content))
 
 
 def _extract_links(content: str) -> set[str]:
     """Extract all wikilinks from content."""
-    return set(re.findall(r"\[\[([^\]|#]+)", content))
+    return set(_LINK_PATTERN.findall(content))
 
 
 def _extract_structural_deps(content: str) -> set[str]:
     """Extract dependencies from ## Structural dependencies section."""
     lowered = content.lower()
-    marker = "## structural dependencies"
-    idx = lowered.find(marker)
+    idx = lowered.find(_DEPS_MARKER)
     if idx == -1:
         return set()
-    start = idx + len(marker)
+    start = idx + len(_DEPS_MARKER)
     end = lowered.find("\n## ", start)
     if end == -1:
         end = len(content)
-    section = content[start:end]
     # Extract wikilinks from section
-    return set(re.findall(r"\[\[([^\]|#]+)", section))
+    return set(_LINK_PATTERN.findall(content, start, end))
 
 
 def _compute_ambiguity_delta(
@@ -235,6 +239,40 @@ def classify_change(
     )
 
 
+def classify_file_change(
+    note_id: str,
+    before_path: Optional[Path],
+    after_path: Optional[Path],
+    git_commit: Optional[str] = None,
+) -> ChangeEvent:
+    """Read before/after files and classify the change.
+
+    Top-level (picklable) so it can run in a worker process.
+    """
+    before_content = before_path.read_text(encoding="utf-8") if before_path else None
+    after_content = after_path.read_text(encoding="utf-8") if after_path else None
+    return classify_change(note_id, before_content, after_content, git_commit=git_commit)
+
+
+def classify_many(
+    entries: list[tuple[str, Optional[Path], Optional[Path], Optional[str]]],
+    *,
+    max_workers: Optional[int] = None,
+) -> list[ChangeEvent]:
+    """Classify many (note_id, before_path, after_path, git_commit) entries.
+
+    Work is spread across a process pool (classification is CPU-bound regex
+    and YAML parsing). Results are returned in input order.
+    """
+    if len(entries) < 2 or max_workers == 1:
+        return [classify_file_change(*entry) for entry in entries]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(classify_file_change, *zip(*entries)))
+
+
 def _extract_section_content(content: str, heading: str) -> str:
     """Extract content of a specific section."""
     lowered = content.lower()
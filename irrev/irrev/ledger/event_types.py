@@ -112,9 +112,14 @@ class ChangeEvent:
     # Provenance
     git_commit: str | None = None  # Optional git SHA
 
-    def to_dict(self) -> dict:
-        """Convert to JSON-serializable dict."""
-        return {
+    def to_dict(self, *, compact: bool = False) -> dict:
+        """Convert to JSON-serializable dict.
+
+        With `compact=True`, empty-list and None effect fields, a zero ambiguity
+        delta and a missing commit are omitted (`from_dict` restores their defaults). The
+        ledger is written this way; user-facing output keeps every key.
+        """
+        data = {
             "timestamp": self.timestamp.isoformat(),
             "note_id": self.note_id,
             "change_types": [ct.value for ct in self.change_types],
@@ -139,6 +144,16 @@ class ChangeEvent:
             "ambiguity_delta": self.ambiguity_delta,
             "git_commit": self.git_commit,
         }
+        if compact:
+            # Keep "" (e.g. a blank role) distinct from None on the round trip
+            data["structural_effects"] = {
+                k: v for k, v in data["structural_effects"].items() if v is not None and v != []
+            }
+            if not self.ambiguity_delta:
+                del data["ambiguity_delta"]
+            if self.git_commit is None:
+                del data["git_commit"]
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "ChangeEvent":
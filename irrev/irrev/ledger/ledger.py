@@ -10,8 +10,9 @@ from __future__ import annotations
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
+from .._jsonl import iter_lines_reversed
 from .event_types import ChangeEvent, ChangeType
 
 
@@ -43,7 +44,20 @@ class ChangeAccountingLedger:
         """
         self._ensure_dir()
         with self.ledger_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(event.to_dict(), separators=(",", ":")) + "\n")
+            f.write(json.dumps(event.to_dict(compact=True), separators=(",", ":")) + "\n")
+
+    def append_many(self, events: Iterable[ChangeEvent]) -> int:
+        """Append several events with a single write, preserving order.
+
+        Returns the number of events written.
+        """
+        lines = [json.dumps(e.to_dict(compact=True), separators=(",", ":")) + "\n" for e in events]
+        if not lines:
+            return 0
+        self._ensure_dir()
+        with self.ledger_path.open("a", encoding="utf-8") as f:
+            f.write("".join(lines))
+        return len(lines)
 
     def read_all(self) -> list[ChangeEvent]:
         """Read all events from the ledger."""
@@ -67,6 +81,38 @@ class ChangeAccountingLedger:
                 if line:
                     yield ChangeEvent.from_dict(json.loads(line))
 
+    def iter_events_reversed(self) -> Iterator[ChangeEvent]:
+        """Iterate over events newest first.
+
+        The ledger is memory-mapped and scanned backwards for line breaks, so
+        stopping after a few events only touches the tail of the file.
+        """
+        if not self.ledger_path.exists():
+            return
+        for line in iter_lines_reversed(self.ledger_path):
+            yield ChangeEvent.from_dict(json.loads(line))
+
+    def read_tail(
+        self,
+        limit: int,
+        where: Callable[[ChangeEvent], bool] | None = None,
+    ) -> list[ChangeEvent]:
+        """Read the last `limit` events (oldest first), optionally filtered.
+
+        Equivalent to `[e for e in read_all() if where(e)][-limit:]`, but the
+        scan stops as soon as `limit` matching events have been found.
+        """
+        tail: list[ChangeEvent] = []
+        if limit <= 0:
+            return tail
+        for event in self.iter_events_reversed():
+            if where is None or where(event):
+                tail.append(event)
+                if len(tail) >= limit:
+                    break
+        tail.reverse()
+        return tail
+
     def count(self) -> int:
         """Count total events in ledger."""
         if not self.ledger_path.exists():
@@ -1,2 +1,6 @@
 """Neo4j integration (derived graph only)."""
 
+# Rows per UNWIND statement. Each batch is one /tx/commit round trip, so this is
+# sized for round-trip amortization rather than statement count. Lives here so
+# the CLI can use it as an option default without importing the load command.
+DEFAULT_BATCH_SIZE = 5000
@@ -4,16 +4,34 @@ This module is intentionally minimal to avoid adding heavy dependencies.
 It targets Neo4j's transactional HTTP endpoint:
   - Neo4j 4+/5: POST /db/{database}/tx/commit
   - Legacy:     POST /db/data/transaction/commit
+
+Requests go over kept-alive `http.client` connections straight to
+`http_uri`: HTTP(S)_PROXY settings are not honoured and redirects are not
+followed (a 3xx response is reported as an error), so point `http_uri` at
+the server itself.
 """
 
 from __future__ import annotations
 
 import base64
+import http.client
 import json
 from dataclasses import dataclass
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
+
+
+class Neo4jError(RuntimeError):
+    """Error reported by Neo4j in a transaction response, with its status code."""
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(f"{code}: {message}")
+        self.code = code
+
+    @property
+    def transient(self) -> bool:
+        """Whether Neo4j classifies the failure as safe to retry (deadlocks etc.)."""
+        return self.code.startswith("Neo.TransientError.")
 
 
 @dataclass(frozen=True)
@@ -44,6 +62,7 @@ class Neo4jHttpClient:
         self._commit_urls.append(f"{base}/db/data/transaction/commit")
 
         self._resolved_commit_url: str | None = None
+        self._conns: dict[tuple[str, str], http.client.HTTPConnection] = {}
 
         token = base64.b64encode(f"{cfg.user}:{cfg.password}".encode("utf-8")).decode("ascii")
         self._auth_header = f"Basic {token}"
@@ -52,53 +71,82 @@ class Neo4jHttpClient:
     def resolved_commit_url(self) -> str | None:
         return self._resolved_commit_url
 
+    def close(self) -> None:
+        """Close any kept-alive connections."""
+        for conn in self._conns.values():
+            conn.close()
+        self._conns.clear()
+
+    def __enter__(self) -> "Neo4jHttpClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        conn = self._conns.get((scheme, netloc))
+        if conn is None:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = cls(netloc, timeout=self._cfg.timeout_s)
+            self._conns[(scheme, netloc)] = conn
+        return conn
+
+    def _post(self, url: str, body: bytes) -> tuple[int, str, bytes]:
+        """POST `body` over a kept-alive connection; returns (status, reason, data)."""
+        parts = urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        headers = {
+            "Authorization": self._auth_header,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        # A kept-alive connection may have been dropped by the server between
+        # requests. That surfaces as RemoteDisconnected (closed before any
+        # response bytes), the one failure retried once on a fresh connection;
+        # anything later may mean the transaction already ran.
+        for attempt in range(2):
+            conn = self._connection(parts.scheme, parts.netloc)
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                del self._conns[(parts.scheme, parts.netloc)]
+                if attempt or not isinstance(e, http.client.RemoteDisconnected):
+                    raise RuntimeError(f"Neo4j connection error: {e}") from e
+                continue
+            if resp.will_close:
+                conn.close()
+                del self._conns[(parts.scheme, parts.netloc)]
+            return resp.status, resp.reason, data
+        raise AssertionError("unreachable")
+
     def commit(self, statements: list[dict[str, Any]]) -> dict[str, Any]:
         """Commit one or more statements and return the decoded JSON payload."""
         body = json.dumps({"statements": statements}).encode("utf-8")
 
-        last_http_error: HTTPError | None = None
-        last_url_error: URLError | None = None
-
         urls = [self._resolved_commit_url] if self._resolved_commit_url else []
         urls += [u for u in self._commit_urls if u not in urls]
 
         for commit_url in urls:
-            req = Request(
-                commit_url,
-                data=body,
-                method="POST",
-                headers={
-                    "Authorization": self._auth_header,
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                },
-            )
-            try:
-                with urlopen(req, timeout=self._cfg.timeout_s) as resp:
-                    payload = json.loads(resp.read().decode("utf-8"))
-                self._resolved_commit_url = commit_url
-                break
-            except HTTPError as e:
-                last_http_error = e
-                if e.code == 404:
-                    continue
-                raise RuntimeError(f"Neo4j HTTP error {e.code}: {e.reason}") from e
-            except URLError as e:
-                last_url_error = e
-                raise RuntimeError(f"Neo4j connection error: {e.reason}") from e
+            status, reason, data = self._post(commit_url, body)
+            if status == 404:
+                continue
+            if not 200 <= status < 300:
+                raise RuntimeError(f"Neo4j HTTP error {status}: {reason}")
+            payload = json.loads(data.decode("utf-8"))
+            self._resolved_commit_url = commit_url
+            break
         else:
-            if last_http_error is not None:
-                raise RuntimeError(f"Neo4j HTTP error 404: Not Found (tried {len(urls)} endpoints)") from last_http_error
-            if last_url_error is not None:
-                raise RuntimeError(f"Neo4j connection error: {last_url_error.reason}") from last_url_error
-            raise RuntimeError("Neo4j commit failed: no response payload")
+            raise RuntimeError(f"Neo4j HTTP error 404: Not Found (tried {len(urls)} endpoints)")
 
         errors = payload.get("errors") or []
         if errors:
             first = errors[0]
             code = first.get("code", "Neo4jError")
             msg = first.get("message", "Unknown Neo4j error")
-            raise RuntimeError(f"{code}: {msg}")
+            raise Neo4jError(code, msg)
 
         return payload
 
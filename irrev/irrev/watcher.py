@@ -28,7 +28,9 @@ from .events import (
     EventKind,
     ArtifactScope,
     ErasureFields,
-    log_event,
+    EventEnvelope,
+    EventLogWriter,
+    build_event,
     classify_scope,
     compute_file_hash,
     format_event,
@@ -101,6 +103,13 @@ class VaultEventHandler(FileSystemEventHandler):
         # Track file hashes for modification detection
         self.file_hashes: dict[str, str] = {}  # path -> hash
 
+        # Writer for the events log; the file is opened per flush
+        self.log_writer = EventLogWriter(vault_path)
+
+    def close(self) -> None:
+        """Close the events log."""
+        self.log_writer.close()
+
     def _is_relevant(self, path: str) -> bool:
         """Check if the file is relevant for tracking."""
         p = Path(path)
@@ -127,9 +136,16 @@ class VaultEventHandler(FileSystemEventHandler):
         path: Path,
         rename_from: str | None = None,
         erasure: ErasureFields | None = None,
+        file_hash: str | None = None,
+        batch: list[EventEnvelope] | None = None,
     ) -> None:
-        """Log an event and notify callback."""
-        envelope = log_event(
+        """
+        Log an event and notify callback.
+
+        When `batch` is given the envelope is collected there instead of being
+        written immediately; the caller appends the whole batch at once.
+        """
+        envelope = build_event(
             vault_path=self.vault_path,
             event_kind=event_kind,
             file_path=path,
@@ -137,8 +153,14 @@ class VaultEventHandler(FileSystemEventHandler):
             include_frontmatter=self.include_frontmatter,
             erasure=erasure,
             rename_from=rename_from,
+            file_hash=file_hash,
         )
 
+        if batch is not None:
+            batch.append(envelope)
+            return
+
+        self.log_writer.append([envelope])
         if self.on_event:
             self.on_event(format_event(envelope))
 
@@ -163,7 +185,12 @@ class VaultEventHandler(FileSystemEventHandler):
         return None
 
     def flush_pending(self) -> None:
-        """Flush any pending events that have passed debounce window."""
+        """
+        Flush any pending events that have passed debounce window.
+
+        Pending events are keyed by path, so a burst of editor writes for one
+        file is hashed once; everything due is appended to the log in one write.
+        """
         now = time.time()
         to_emit = []
 
@@ -172,6 +199,7 @@ class VaultEventHandler(FileSystemEventHandler):
                 to_emit.append((path_str, pending))
                 del self.pending[path_str]
 
+        batch: list[EventEnvelope] = []
         for path_str, pending in to_emit:
             path = pending.path
 
@@ -181,9 +209,11 @@ class VaultEventHandler(FileSystemEventHandler):
                 rename_from = self._check_rename(path, new_hash)
 
                 if rename_from:
-                    self._emit_event(EventKind.FILE_RENAMED, path, rename_from=rename_from)
+                    self._emit_event(
+                        EventKind.FILE_RENAMED, path, rename_from=rename_from, file_hash=new_hash, batch=batch
+                    )
                 else:
-                    self._emit_event(EventKind.FILE_CREATED, path)
+                    self._emit_event(EventKind.FILE_CREATED, path, file_hash=new_hash, batch=batch)
 
                 # Track hash for future modifications
                 if new_hash:
@@ -195,7 +225,7 @@ class VaultEventHandler(FileSystemEventHandler):
                 old_hash = self.file_hashes.get(path_str)
 
                 if new_hash != old_hash:
-                    self._emit_event(EventKind.FILE_MODIFIED, path)
+                    self._emit_event(EventKind.FILE_MODIFIED, path, file_hash=new_hash, batch=batch)
                     if new_hash:
                         self.file_hashes[path_str] = new_hash
 
@@ -205,11 +235,16 @@ class VaultEventHandler(FileSystemEventHandler):
                     self.deleted_hashes[pending.old_hash] = (path_str, now)
 
                 erasure = ErasureFields(bytes_erased=pending.old_size)
-                self._emit_event(EventKind.FILE_DELETED, path, erasure=erasure)
+                self._emit_event(EventKind.FILE_DELETED, path, erasure=erasure, batch=batch)
 
                 # Remove from tracked hashes
                 self.file_hashes.pop(path_str, None)
 
+        self.log_writer.append(batch)
+        if self.on_event:
+            for envelope in batch:
+                self.on_event(format_event(envelope))
+
     def on_created(self, event: FileCreatedEvent) -> None:
         """Handle file creation."""
         if event.is_directory or not self._is_relevant(event.src_path):
@@ -360,6 +395,8 @@ def run_watch_loop(
             time.sleep(0.5)
             handler.flush_pending()
     except KeyboardInterrupt:
+        pass
+    finally:
         observer.stop()
-
-    observer.join()
+        observer.join()
+        handler.close()
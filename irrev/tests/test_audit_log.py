@@ -0,0 +1,137 @@
+"""Tests for the erasure-cost audit log."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from irrev.audit_log import (
+    AuditEntry,
+    CreationSummary,
+    ErasureCost,
+    follow_audit_log,
+    iter_audit_log,
+    log_operation,
+    read_audit_log,
+)
+
+
+def test_log_operation_round_trips(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+
+    entry = log_operation(
+        vault,
+        operation="registry-in-place",
+        erased=ErasureCost(notes=1),
+        created=CreationSummary(files=2),
+        metadata={"target": "Registry.md"},
+    )
+
+    entries = read_audit_log(vault)
+    assert len(entries) == 1
+    assert entries[0].timestamp == entry.timestamp
+    assert entries[0].erased.notes == 1
+    assert entries[0].created.files == 2
+    assert entries[0].metadata == {"target": "Registry.md"}
+
+
+def test_read_audit_log_last_n_matches_full_scan(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+    for i in range(200):
+        log_operation(vault, operation=f"op-{i}", metadata={"i": i})
+
+    log_path = tmp_path / ".irrev" / "audit.log"
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write("not json\n\n")
+    log_operation(vault, operation="op-last")
+
+    full = read_audit_log(vault)
+    assert log_path.stat().st_size > 4096
+    for n in (1, 3, 50, 500):
+        tail = read_audit_log(vault, last_n=n)
+        assert [e.operation for e in tail] == [e.operation for e in full[-n:]]
+
+
+def test_read_audit_log_last_n_small_file(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+    for i in range(3):
+        log_operation(vault, operation=f"op-{i}")
+
+    assert [e.operation for e in read_audit_log(vault, last_n=2)] == ["op-1", "op-2"]
+
+
+def test_log_operation_metadata_is_read_only(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+
+    entry = log_operation(vault, operation="neo4j-sync", metadata={"database": "irrev"})
+    bare = log_operation(vault, operation="neo4j-sync")
+
+    with pytest.raises(TypeError):
+        entry.metadata["database"] = "other"  # type: ignore[index]
+    assert dict(bare.metadata) == {}
+    assert read_audit_log(vault)[0].to_dict()["metadata"] == {"database": "irrev"}
+
+
+def test_to_dict_matches_asdict() -> None:
+    entry = AuditEntry(
+        timestamp="2026-01-01T00:00:00+00:00",
+        operation="registry-in-place",
+        erased=ErasureCost(notes=1, edges=2, files=3, bytes_erased=4, details={"a": 1}),
+        created=CreationSummary(notes=5, bytes_written=6, details={"b": [1, 2]}),
+        metadata={"target": "Registry.md"},
+    )
+
+    assert entry.to_dict() == {
+        "timestamp": entry.timestamp,
+        "operation": entry.operation,
+        "erased": asdict(entry.erased),
+        "created": asdict(entry.created),
+        "metadata": dict(entry.metadata),
+    }
+    assert entry.to_dict()["erased"]["details"] is not entry.erased.details
+
+
+def test_iter_audit_log_is_lazy(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+    assert list(iter_audit_log(vault)) == []
+
+    log_operation(vault, operation="op-0")
+    log_operation(vault, operation="op-1")
+
+    it = iter_audit_log(vault)
+    assert next(it).operation == "op-0"
+    assert [e.operation for e in it] == ["op-1"]
+
+
+def test_log_operation_recreates_a_removed_log(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+    log_operation(vault, operation="op-0")
+
+    log_path = tmp_path / ".irrev" / "audit.log"
+    log_path.rename(tmp_path / ".irrev" / "audit.log.1")
+    log_operation(vault, operation="op-1")
+
+    assert [e.operation for e in read_audit_log(vault)] == ["op-1"]
+
+
+def test_follow_resumes_at_tail_end_offset(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+    log_operation(vault, operation="op-0")
+    log_operation(vault, operation="op-1")
+
+    end_offset = (tmp_path / ".irrev" / "audit.log").stat().st_size
+    tail = read_audit_log(vault, last_n=5, end_offset=end_offset)
+    log_operation(vault, operation="op-2")  # Appended between tail and follow
+
+    follow = follow_audit_log(vault, poll_interval=0.01, start_offset=end_offset)
+    assert [e.operation for e in tail] == ["op-0", "op-1"]
+    assert next(follow).operation == "op-2"
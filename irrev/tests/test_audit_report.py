@@ -0,0 +1,19 @@
+"""Tests for loading the Obsidian Bases CSV exports."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from irrev.commands.audit import load_audit_data
+
+
+def test_load_audit_data_matches_export_names_case_insensitively(tmp_path: Path) -> None:
+    (tmp_path / "full vault AUDIT.csv").write_text(
+        "note,location,modified,outlinks,tagged\n[[concepts/a.md|a]],concepts,2026-01-01,3,yes\n",
+        encoding="utf-8",
+    )
+
+    data = load_audit_data(tmp_path)
+
+    assert [row.name for row in data.vault_notes] == ["a"]
+    assert data.vault_notes[0].outlinks == 3
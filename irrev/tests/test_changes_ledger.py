@@ -0,0 +1,196 @@
+"""Tests for the change accounting ledger and bulk recording."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from irrev.cli import cli
+from irrev.ledger import ChangeAccountingLedger, ChangeType, classify_many
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_classify_many_preserves_order(tmp_path: Path) -> None:
+    before = _write(tmp_path / "before.md", "## Definition\nold\n")
+    after = _write(tmp_path / "after.md", "## Definition\nnew\n\n## Structural dependencies\n[[other]]\n")
+
+    entries = [(f"concepts/n{i}", before, after, None) for i in range(4)]
+    serial = classify_many(entries, max_workers=1)
+    pooled = classify_many(entries, max_workers=2)
+
+    assert [e.note_id for e in pooled] == [f"concepts/n{i}" for i in range(4)]
+    assert [e.change_types for e in pooled] == [e.change_types for e in serial]
+    assert ChangeType.DEPENDENCY_ADDITION in pooled[0].change_types
+
+
+def test_record_bulk_appends_in_manifest_order(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+    _write(tmp_path / "a.md", "## Definition\nA\n")
+    _write(tmp_path / "b.md", "## Definition\nB\n")
+    manifest = _write(
+        tmp_path / "manifest.json",
+        json.dumps(
+            [
+                {"note_id": "concepts/a", "after": "a.md"},
+                {"note_id": "concepts/b", "before": "a.md", "after": "b.md", "commit": "abc123"},
+            ]
+        ),
+    )
+
+    result = CliRunner().invoke(cli, ["-v", str(vault), "changes", "record-bulk", str(manifest), "--workers", "1"])
+
+    assert result.exit_code == 0, result.output
+    events = ChangeAccountingLedger(vault).read_all()
+    assert [e.note_id for e in events] == ["concepts/a", "concepts/b"]
+    assert events[1].git_commit == "abc123"
+
+    shown = CliRunner().invoke(cli, ["-v", str(vault), "changes", "show", "--json"])
+    assert shown.exit_code == 0, shown.output
+    assert [json.loads(line)["note_id"] for line in shown.output.splitlines()] == ["concepts/a", "concepts/b"]
+
+
+def test_record_bulk_rejects_bad_manifest_before_recording(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+    _write(tmp_path / "a.md", "## Definition\nA\n")
+    missing = _write(
+        tmp_path / "missing.json",
+        json.dumps([{"note_id": "concepts/a", "after": "a.md"}, {"note_id": "concepts/b", "after": "gone.md"}]),
+    )
+    broken = _write(tmp_path / "broken.json", "[{")
+    (tmp_path / "notes").mkdir()
+    cases = {
+        missing: "'after' is not a file",
+        broken: "invalid JSON",
+        _write(tmp_path / "dir.json", json.dumps([{"note_id": "concepts/a", "before": "notes"}])): "'before' is not a file",
+        _write(tmp_path / "typed.json", json.dumps([{"note_id": "concepts/a", "after": 3}])): "'after' must be a path string",
+        _write(tmp_path / "no_id.json", json.dumps([{"after": "a.md"}])): "'note_id' must be a non-empty string",
+    }
+
+    for manifest, message in cases.items():
+        result = CliRunner().invoke(cli, ["-v", str(vault), "changes", "record-bulk", str(manifest)])
+        assert result.exit_code == 2, result.output
+        assert "MANIFEST" in result.output and message in result.output
+    assert ChangeAccountingLedger(vault).read_all() == []
+
+
+def test_ndjson_fallback_matches_orjson(monkeypatch) -> None:
+    orjson = pytest.importorskip("orjson")
+    from irrev.commands import _ndjson
+
+    record = {"note_id": "concepts/ü", "types": ["x"], "delta": -1, "commit": None}
+    fast = _ndjson.dumps_line(record)
+    assert fast == orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    monkeypatch.setattr(_ndjson, "orjson", None)
+
+    assert _ndjson.dumps_line(record) == fast
+    assert json.loads(fast) == record
+
+
+def test_read_tail_matches_filtered_full_scan(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+    before = _write(tmp_path / "before.md", "## Definition\nold\n")
+    after = _write(tmp_path / "after.md", "## Definition\nnew\n")
+    ledger = ChangeAccountingLedger(vault)
+    assert ledger.read_tail(5) == []
+
+    ledger.append_many(classify_many([(f"concepts/n{i}", before if i % 3 else None, after, None) for i in range(30)]))
+
+    full = ledger.read_all()
+    assert [e.note_id for e in ledger.read_tail(4)] == [e.note_id for e in full[-4:]]
+    assert [e.note_id for e in ledger.read_tail(100)] == [e.note_id for e in full]
+
+    def refined(e) -> bool:
+        return ChangeType.DEFINITION_REFINEMENT in e.change_types
+
+    expected = [e.note_id for e in full if refined(e)][-3:]
+    assert [e.note_id for e in ledger.read_tail(3, where=refined)] == expected
+
+
+def test_ledger_package_exports_resolve_lazily() -> None:
+    import subprocess
+    import sys
+
+    import irrev.ledger as ledger
+
+    for name in ledger.__all__:
+        assert getattr(ledger, name) is not None
+
+    code = "import sys; from irrev.ledger import ChangeAccountingLedger; print('irrev.ledger.classifier' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "False"
+
+
+def test_changes_show_text_listing(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+    before = _write(tmp_path / "before.md", "## Definition\nold\n")
+    after = _write(tmp_path / "after.md", "## Definition\nnew\n\n## Structural dependencies\n[[other]]\n")
+    ChangeAccountingLedger(vault).append_many(classify_many([("concepts/a", before, after, None)], max_workers=1))
+    event = ChangeAccountingLedger(vault).read_all()[0]
+
+    shown = CliRunner().invoke(cli, ["-v", str(vault), "changes", "show"])
+
+    assert shown.exit_code == 0, shown.output
+    assert shown.output == (
+        f"{event.timestamp.isoformat()} concepts/a\n"
+        f"  Types: {[ct.value for ct in event.change_types]}\n"
+        "  Deps added: other\n"
+        f"  Ambiguity: {event.ambiguity_delta:+d}\n"
+        "\n"
+    )
+
+
+def test_ledger_writes_compact_events_that_round_trip(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+    before = _write(tmp_path / "before.md", "## Definition\nold\n")
+    after = _write(tmp_path / "after.md", "## Definition\nnew\n\n## Structural dependencies\n[[other]]\n")
+    events = classify_many([("concepts/a", before, after, "abc"), ("concepts/b", None, before, None)], max_workers=1)
+
+    ledger = ChangeAccountingLedger(vault)
+    ledger.append_many(events)
+
+    raw = [json.loads(line) for line in ledger.ledger_path.read_text(encoding="utf-8").splitlines()]
+    assert "git_commit" not in raw[1]
+    assert all(raw[0]["structural_effects"].values())
+    assert [e.to_dict() for e in ledger.read_all()] == [e.to_dict() for e in events]
+
+
+def test_compact_events_keep_empty_strings() -> None:
+    from datetime import datetime, timezone
+
+    from irrev.ledger.event_types import ChangeEvent, StructuralEffects
+
+    event = ChangeEvent(
+        timestamp=datetime.now(timezone.utc),
+        note_id="concepts/a",
+        change_types=(ChangeType.ROLE_CHANGE,),
+        structural_effects=StructuralEffects(role_before="", role_after="primitive"),
+    )
+
+    data = event.to_dict(compact=True)
+    assert data["structural_effects"] == {"role_before": "", "role_after": "primitive"}
+    assert ChangeEvent.from_dict(data) == event
+
+
+def test_changes_record_reports_plain_text(tmp_path: Path) -> None:
+    vault = tmp_path / "content"
+    vault.mkdir()
+    after = _write(tmp_path / "a.md", "## Definition\nA\n")
+
+    result = CliRunner().invoke(cli, ["-v", str(vault), "changes", "record", "concepts/a", "--after", str(after)])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.startswith("Recorded: concepts/a\n  Types: ")
+    assert "\x1b[" not in result.output
+    assert [e.note_id for e in ChangeAccountingLedger(vault).read_all()] == ["concepts/a"]
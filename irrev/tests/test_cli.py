@@ -0,0 +1,189 @@
+"""Tests for the click entrypoint wiring."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from irrev.cli import cli
+
+
+def test_lint_accepts_full_option_set(fixture_vault_path: Path) -> None:
+    result = CliRunner().invoke(cli, ["-v", str(fixture_vault_path), "lint", "--help"])
+
+    assert result.exit_code == 0
+    for opt in ("--invariant", "--strict", "--summary", "--explain", "--explain-invariant", "--trace"):
+        assert opt in result.output
+
+
+def test_lint_invariant_filter_runs(fixture_vault_path: Path) -> None:
+    base = ["-v", str(fixture_vault_path), "lint", "--json"]
+    unfiltered = json.loads(CliRunner().invoke(cli, base).stdout)
+    result = CliRunner().invoke(cli, [*base, "--invariant", "decomposition"])
+
+    filtered = json.loads(result.stdout)
+    assert result.exit_code == 1
+    assert filtered["errors"]
+    assert {e["invariant"] for e in filtered["errors"]} == {"decomposition"}
+    assert {e["invariant"] for e in unfiltered["errors"]} > {"decomposition"}
+    assert list(filtered["by_invariant"]) == ["decomposition"]
+
+
+def test_audit_log_tail(tmp_path: Path) -> None:
+    from irrev.audit_log import log_operation
+
+    vault = tmp_path / "content"
+    vault.mkdir()
+    for i in range(5):
+        log_operation(vault, operation=f"op-{i}")
+
+    result = CliRunner().invoke(cli, ["-v", str(vault), "audit-log", "--tail", "2"])
+
+    assert result.exit_code == 0
+    assert "op-3" in result.output and "op-4" in result.output
+    assert "op-2" not in result.output
+
+    result = CliRunner().invoke(cli, ["-v", str(vault), "audit-log", "--tail", "0"])
+    assert result.exit_code == 2
+
+
+def test_lazy_subcommands_resolve() -> None:
+    import click
+
+    ctx = click.Context(cli)
+    for name in cli.list_commands(ctx):
+        cmd = cli.get_command(ctx, name)
+        assert isinstance(cmd, click.Command)
+        assert cmd.name == name
+
+
+def test_auto_detect_vault_walks_up(tmp_path: Path) -> None:
+    from irrev.cli import _auto_detect_vault
+
+    nested = tmp_path / "repo" / "a" / "b"
+    nested.mkdir(parents=True)
+    (tmp_path / "repo" / "content").mkdir()
+
+    assert _auto_detect_vault(str(nested)) == (tmp_path / "repo" / "content").resolve()
+    assert _auto_detect_vault(str(tmp_path / "repo" / "content")) == (tmp_path / "repo" / "content").resolve()
+
+
+def test_auto_detect_vault_matches_case_variant_ancestor(tmp_path: Path) -> None:
+    from irrev.cli import _auto_detect_vault
+
+    nested = tmp_path / "x" / "Content" / "sub"
+    nested.mkdir(parents=True)
+
+    assert _auto_detect_vault(str(nested)) == (tmp_path / "x" / "Content").resolve()
+
+
+def test_commands_package_resolves_run_entrypoints() -> None:
+    import irrev.commands as commands
+
+    for name in commands.__all__:
+        assert callable(getattr(commands, name))
+
+
+def test_subcommand_help_skips_vault_lookup(tmp_path: Path) -> None:
+    missing = tmp_path / "no-such-vault"
+
+    assert CliRunner().invoke(cli, ["-v", str(missing), "lint", "--help"]).exit_code == 0
+    assert CliRunner().invoke(cli, ["-v", str(missing), "registry", "build", "--help"]).exit_code == 0
+    assert CliRunner().invoke(cli, ["-v", str(missing), "lint"]).exit_code != 0
+
+
+def test_neo4j_commands_share_connection_options() -> None:
+    from irrev.cli_cmds.neo4j import neo4j
+
+    for cmd in neo4j.commands.values():
+        assert [p.name for p in cmd.params[:4]] == ["http_uri", "user", "password", "database"]
+
+
+def test_main_version_fast_path_matches_click(monkeypatch, capsys) -> None:
+    from irrev.__main__ import main
+
+    monkeypatch.setattr("sys.argv", ["irrev", "--version"])
+    main()
+
+    assert capsys.readouterr().out == CliRunner().invoke(cli, ["--version"]).output
+
+
+def test_version_fast_path_skips_click() -> None:
+    import subprocess
+    import sys
+
+    from irrev import __version__
+
+    code = "import sys; sys.argv = ['irrev', '--version']; from irrev.__main__ import main; main(); print('click' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert out.splitlines() == [f"irrev, version {__version__}", "False"]
+
+
+def test_lint_json_skips_rich(fixture_vault_path: Path) -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; from pathlib import Path; from irrev.commands.lint import run_lint; "
+        f"run_lint(Path({str(fixture_vault_path)!r}), output_json=True, invariant_filter='governance'); "
+        "print('rich' in sys.modules, file=sys.stderr)"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert proc.stderr.splitlines()[-1] == "False"
+    assert "⚠ Governance notice: --invariant filter active" in proc.stderr
+    assert "errors" in json.loads(proc.stdout)
+
+
+def test_lint_plain_stderr_keeps_bracketed_content(capsys) -> None:
+    from irrev.commands.lint import _PlainStderr
+
+    _PlainStderr().print("[yellow]Notice:[/] dep [missing] in [some rule]")
+
+    assert capsys.readouterr().err == "Notice: dep [missing] in [some rule]\n"
+
+
+def test_neo4j_load_routes_execution_options(fixture_vault_path: Path, tmp_path: Path, monkeypatch) -> None:
+    seen: dict = {}
+
+    def fake_from_plan_id(vault, **kwargs) -> int:
+        seen.update(kwargs)
+        return 0
+
+    monkeypatch.setattr("irrev.commands.run_neo4j_load_from_plan_id", fake_from_plan_id)
+    base = ["-v", str(fixture_vault_path), "neo4j", "load", "--password", "pw"]
+    csv_opts = ["--bulk-loader", "load_csv", "--import-dir", str(tmp_path)]
+
+    result = CliRunner().invoke(cli, [*base, "--plan-id", "P1", "--concurrency", "2", *csv_opts])
+    assert result.exit_code == 0, result.output
+    assert seen["concurrency"] == 2 and seen["import_dir"] == tmp_path
+    result = CliRunner().invoke(cli, [*base, "--plan-id", "P1"])
+    assert result.exit_code == 0, result.output
+    assert seen["concurrency"] == 1
+
+    for extra in (csv_opts, ["--concurrency", "2"]):
+        result = CliRunner().invoke(cli, [*base, "--propose-only", *extra])
+        assert result.exit_code == 2
+        assert "has no effect with --propose-only" in result.output
+    result = CliRunner().invoke(cli, [*base, "--dry-run", "--import-dir", str(tmp_path)])
+    assert result.exit_code == 2
+
+
+def test_neo4j_load_batch_size_default_is_shared() -> None:
+    from irrev.cli_cmds.neo4j import neo4j_load
+    from irrev.neo4j import DEFAULT_BATCH_SIZE
+
+    assert next(p for p in neo4j_load.params if p.name == "batch_size").default == DEFAULT_BATCH_SIZE
+
+
+def test_help_as_option_value_still_resolves_vault(fixture_vault_path: Path, tmp_path: Path) -> None:
+    shown = CliRunner().invoke(cli, ["-v", str(fixture_vault_path), "changes", "show", "--note", "--help"])
+    assert shown.exit_code == 0, shown.output
+    assert "Usage:" not in shown.output
+
+    missing = CliRunner().invoke(cli, ["-v", str(tmp_path / "nope"), "changes", "show", "--note", "--help"])
+    assert missing.exit_code == 2
+    assert "does not exist" in missing.output
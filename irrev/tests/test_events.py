@@ -0,0 +1,107 @@
+"""Tests for vault file-system event helpers."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from irrev.events import compute_file_hash
+
+
+def test_compute_file_hash_matches_sha256_prefix(tmp_path: Path) -> None:
+    data = b"# Note\n" + b"x" * (3 << 20)
+    path = tmp_path / "note.md"
+    path.write_bytes(data)
+
+    assert compute_file_hash(path) == hashlib.sha256(data).hexdigest()[:16]
+    assert compute_file_hash(tmp_path / "missing.md") is None
+
+
+def test_watcher_coalesces_burst_into_one_event(tmp_path: Path) -> None:
+    from watchdog.events import FileCreatedEvent, FileModifiedEvent
+
+    from irrev.events import read_events_log
+    from irrev.watcher import VaultEventHandler
+
+    vault = tmp_path / "content"
+    vault.mkdir()
+    note = vault / "Note.md"
+    note.write_text("# Note\n", encoding="utf-8")
+
+    handler = VaultEventHandler(vault, include_hash=True)
+    handler.on_created(FileCreatedEvent(str(note)))
+    for _ in range(5):
+        handler.on_modified(FileModifiedEvent(str(note)))
+    handler.on_created(FileCreatedEvent(str(vault / "Other.md")))
+    for pending in handler.pending.values():
+        pending.timestamp -= handler.DEBOUNCE_SECONDS
+    handler.flush_pending()
+    handler.close()
+
+    events = read_events_log(vault)
+    assert [e.event_kind.value for e in events] == ["file_created", "file_created"]
+    assert events[0].artifact.hash == compute_file_hash(note)
+    assert handler.pending == {}
+
+
+def test_event_log_writer_appends_batches(tmp_path: Path) -> None:
+    from irrev.events import EventKind, EventLogWriter, build_event, read_events_log
+
+    vault = tmp_path / "content"
+    vault.mkdir()
+    envelopes = [build_event(vault, EventKind.FILE_CREATED, vault / f"n{i}.md") for i in range(1500)]
+
+    with EventLogWriter(vault) as writer:
+        writer.append(envelopes[:3])
+        writer.append(envelopes[3:])
+
+    assert [e.artifact.path for e in read_events_log(vault)] == [e.artifact.path for e in envelopes]
+
+
+def test_event_log_writer_recreates_a_removed_log(tmp_path: Path) -> None:
+    from irrev.events import EventKind, EventLogWriter, build_event, get_events_log_path, read_events_log
+
+    vault = tmp_path / "content"
+    vault.mkdir()
+    log_path = get_events_log_path(vault)
+
+    with EventLogWriter(vault) as writer:
+        writer.append([build_event(vault, EventKind.FILE_CREATED, vault / "a.md")])
+        log_path.rename(log_path.with_name("events.log.1"))
+        writer.append([build_event(vault, EventKind.FILE_CREATED, vault / "b.md")])
+
+    assert [e.artifact.path for e in read_events_log(vault)] == [str(vault / "b.md")]
+
+
+def test_read_events_log_last_n_matches_full_scan(tmp_path: Path) -> None:
+    from irrev.events import EventKind, EventLogWriter, build_event, get_events_log_path, read_events_log
+
+    vault = tmp_path / "content"
+    vault.mkdir()
+    kinds = [EventKind.FILE_CREATED, EventKind.FILE_MODIFIED, EventKind.FILE_DELETED]
+    with EventLogWriter(vault) as writer:
+        writer.append([build_event(vault, kinds[i % 3], vault / f"n{i}.md") for i in range(200)])
+    with get_events_log_path(vault).open("a", encoding="utf-8") as f:
+        f.write("not json\n\n")
+
+    modified = [EventKind.FILE_MODIFIED]
+    for n in (1, 5, 80, 500):
+        assert read_events_log(vault, last_n=n) == read_events_log(vault)[-n:]
+        assert read_events_log(vault, last_n=n, event_kinds=modified) == read_events_log(vault, event_kinds=modified)[-n:]
+
+
+def test_events_summary_streams_counts(tmp_path: Path, capsys) -> None:
+    from irrev.commands.watch_cmd import run_events_summary
+    from irrev.events import EventKind, EventLogWriter, build_event
+
+    vault = tmp_path / "content"
+    vault.mkdir()
+    assert run_events_summary(vault) == 0
+
+    kinds = [EventKind.FILE_CREATED, EventKind.FILE_MODIFIED, EventKind.FILE_MODIFIED]
+    with EventLogWriter(vault) as writer:
+        writer.append([build_event(vault, kind, vault / "n.md") for kind in kinds])
+
+    assert run_events_summary(vault) == 3
+    out = capsys.readouterr().out
+    assert "file_modified" in out and "First event" in out
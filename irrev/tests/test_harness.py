@@ -386,6 +386,20 @@ class TestHandlerRegistry:
         retrieved = get_handler("unknown.operation")
         assert retrieved is None
 
+    def test_register_all_is_idempotent(self):
+        from irrev.harness.handlers import register_all
+        from irrev.harness.registry import get_handler
+
+        clear_handlers()
+        register_all()
+        first = get_handler("neo4j.load")
+        register_all()
+        assert get_handler("neo4j.load") is first
+
+        clear_handlers()
+        register_all()
+        assert get_handler("neo4j.load") is first
+
 
 class TestLedgerEnrichment:
     """Tests for ledger enrichment with context and metadata."""
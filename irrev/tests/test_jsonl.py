@@ -0,0 +1,25 @@
+"""Tests for the shared JSON Lines helpers."""
+
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+
+from irrev._jsonl import iter_lines_reversed
+
+
+def test_iter_lines_reversed_small_and_mapped_files(tmp_path: Path) -> None:
+    for count in (3, mmap.PAGESIZE // 8 + 10):
+        path = tmp_path / f"{count}.jsonl"
+        lines = [f'{{"i":{i}}}'.encode() for i in range(count)]
+        path.write_bytes(b"\n".join(lines[:2]) + b"\n\n \n" + b"\n".join(lines[2:]))  # no trailing newline
+
+        assert list(iter_lines_reversed(path)) == lines[::-1]
+        cut = len(b"\n".join(lines[:2])) + 1
+        assert list(iter_lines_reversed(path, end_offset=cut)) == lines[1::-1]
+
+
+def test_iter_lines_reversed_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "empty.jsonl"
+    path.write_bytes(b"")
+    assert list(iter_lines_reversed(path)) == []
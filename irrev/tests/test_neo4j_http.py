@@ -0,0 +1,239 @@
+"""Tests for the dependency-free Neo4j HTTP client."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+
+from irrev.neo4j.http import Neo4jHttpClient, Neo4jHttpConfig
+
+
+class _TxHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set[int] = set()
+    bodies: list[dict] = []
+    errors: list[dict] = []
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        type(self).connections.add(id(self.connection))
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).bodies.append(body)
+        if self.path == "/db/moved/tx/commit":
+            self.send_response(301)
+            self.send_header("Location", "/db/irrev/tx/commit")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path != "/db/irrev/tx/commit":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        errors = [type(self).errors.pop(0)] if type(self).errors else []
+        data = json.dumps({"results": [{"columns": ["x"], "data": [{"row": [1]}]}], "errors": errors}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def neo4j_server() -> Iterator[str]:
+    _TxHandler.connections = set()
+    _TxHandler.bodies = []
+    _TxHandler.errors = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TxHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_commits_reuse_one_connection(neo4j_server: str) -> None:
+    cfg = Neo4jHttpConfig(http_uri=neo4j_server, user="neo4j", password="pw", database="irrev")
+    with Neo4jHttpClient(cfg) as client:
+        for _ in range(3):
+            columns, rows = client.query_rows("RETURN 1 AS x")
+            assert columns == ["x"]
+            assert rows == [[1]]
+
+    assert len(_TxHandler.bodies) == 3
+    assert len(_TxHandler.connections) == 1
+
+
+def test_unknown_database_reports_404(neo4j_server: str) -> None:
+    cfg = Neo4jHttpConfig(http_uri=neo4j_server, user="neo4j", password="pw", database="missing")
+    with Neo4jHttpClient(cfg) as client, pytest.raises(RuntimeError, match="404"):
+        client.commit([{"statement": "RETURN 1"}])
+
+
+def test_redirect_reports_http_error(neo4j_server: str) -> None:
+    cfg = Neo4jHttpConfig(http_uri=neo4j_server, user="neo4j", password="pw", database="moved")
+    with Neo4jHttpClient(cfg) as client, pytest.raises(RuntimeError, match="HTTP error 301"):
+        client.commit([{"statement": "RETURN 1"}])
+
+
+def test_commit_batches_concurrently(neo4j_server: str) -> None:
+    from irrev.commands.neo4j_cmd import _commit_batches
+
+    cfg = Neo4jHttpConfig(http_uri=neo4j_server, user="neo4j", password="pw", database="irrev")
+    statements = [{"statement": "RETURN $i", "parameters": {"i": i}} for i in range(8)]
+    with Neo4jHttpClient(cfg) as client:
+        _commit_batches(client, cfg, statements, concurrency=3)
+
+    sent = sorted(b["statements"][0]["parameters"]["i"] for b in _TxHandler.bodies)
+    assert sent == list(range(8))
+    assert all(len(b["statements"]) == 1 for b in _TxHandler.bodies)
+
+
+def test_query_pages_walks_offsets_until_short_page() -> None:
+    from irrev.commands.neo4j_cmd import _query_pages
+
+    data = [[i] for i in range(7)]
+    calls: list[dict] = []
+
+    class _Client:
+        def query_rows(self, query: str, *, parameters: dict) -> tuple[list[str], list[list[int]]]:
+            calls.append(parameters)
+            return ["i"], data[parameters["offset"] : parameters["offset"] + parameters["page"]]
+
+    rows = list(_query_pages(_Client(), "RETURN 1 SKIP $offset LIMIT $page", page_size=3))  # type: ignore[arg-type]
+
+    assert rows == data
+    assert [c["offset"] for c in calls] == [0, 3, 6]
+
+
+def test_export_writers_gzip_when_compressed(tmp_path) -> None:
+    import csv
+    import gzip
+
+    from irrev.commands.neo4j_cmd import _write_csv, _write_json
+
+    rows = [["concepts/a", "A, with comma"], ["concepts/b", "B"]]
+    _write_csv(tmp_path / "nodes.csv", ["id", "label"], iter(rows), compress=True)
+    _write_json(tmp_path / "graph.json", {"nodes": rows}, compress=True)
+
+    assert not (tmp_path / "nodes.csv").exists()
+    with gzip.open(tmp_path / "nodes.csv.gz", "rt", encoding="utf-8", newline="") as f:
+        assert list(csv.reader(f)) == [["id", "label"], *rows]
+    with gzip.open(tmp_path / "graph.json.gz", "rt", encoding="utf-8") as f:
+        assert json.load(f) == {"nodes": rows}
+
+
+def test_write_json_arrays_matches_json_dump() -> None:
+    import io
+
+    from irrev.commands.neo4j_cmd import _write_json_arrays
+
+    nodes = [{"id": "concepts/a", "label": "Ä \"quoted\"\nline", "tags": ["x", {"y": None}], "empty": []}, {"id": 2}]
+    for obj in ({"nodes": nodes, "links": []}, {"nodes": [], "links": nodes}, {}):
+        out = io.StringIO()
+        _write_json_arrays(out, ((k, iter(v)) for k, v in obj.items()))
+        assert out.getvalue() == json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def test_load_csv_bulk_loader_stages_and_cleans_up(neo4j_server: str, tmp_path) -> None:
+    from rich.console import Console
+
+    from irrev.commands.neo4j_cmd import execute_neo4j_load_plan
+    from irrev.planning import Neo4jLoadPlan
+
+    notes = [{"note_id": f"concepts/n{i}", "tags": ["a", "b"], "canonical": i == 0} for i in range(3)]
+    plan = Neo4jLoadPlan(
+        vault_path=tmp_path,
+        mode="sync",
+        database="irrev",
+        http_uri=neo4j_server,
+        notes=notes,
+        links_to=[("concepts/n0", "concepts/n1")],
+        depends_on=[("concepts/n1", "concepts/n2")],
+    )
+    import_dir = tmp_path / "import"
+    import_dir.mkdir()
+
+    result = execute_neo4j_load_plan(
+        plan,
+        user="neo4j",
+        password="pw",
+        ensure_schema=False,
+        batch_size=2,
+        console=Console(quiet=True),
+        import_dir=import_dir,
+    )
+
+    assert result.success, result.error
+    statements = [st for b in _TxHandler.bodies for st in b["statements"]]
+    urls = [st["parameters"]["url"] for st in statements if st["statement"].lstrip().startswith("LOAD CSV")]
+    assert len(urls) == 4  # two note batches, one per edge type
+    assert all(u.startswith("file:///irrev_") and u.endswith(".csv") for u in urls)
+    assert not any("$rows" in st["statement"] or "$edges" in st["statement"] for st in statements[:-1])
+    assert list(import_dir.iterdir()) == []
+
+
+def test_map_with_clients_uses_one_client_per_worker(neo4j_server: str) -> None:
+    from irrev.commands.neo4j_cmd import _map_with_clients
+
+    cfg = Neo4jHttpConfig(http_uri=neo4j_server, user="neo4j", password="pw", database="irrev")
+    seen: list[int] = []
+    lock = threading.Lock()
+
+    def query(worker: Neo4jHttpClient, i: int) -> None:
+        worker.query_rows("RETURN $i", parameters={"i": i})
+        with lock:
+            seen.append(i)
+
+    with Neo4jHttpClient(cfg) as client:
+        _map_with_clients(client, cfg, query, list(range(10)), concurrency=3)
+
+    assert sorted(seen) == list(range(10))
+    assert len(_TxHandler.connections) <= 3
+
+
+def test_load_csv_rows_keep_empty_strings_distinct_from_null(tmp_path) -> None:
+    import csv
+
+    from irrev.commands.neo4j_cmd import _CSV_NOTE_COLUMNS, _csv_note_row, _write_csv
+
+    row = {"note_id": "concepts/a", "title": "", "role": None, "tags": [], "aliases": ["x", "y"], "canonical": True}
+    _write_csv(tmp_path / "notes.csv", list(_CSV_NOTE_COLUMNS), [_csv_note_row(row)])
+
+    with open(tmp_path / "notes.csv", encoding="utf-8", newline="") as f:
+        staged = next(csv.DictReader(f))
+    # LOAD CSV reads an empty cell as null; anything present carries the prefix.
+    assert staged["note_id"] == "=concepts/a"
+    assert staged["title"] == "="
+    assert staged["role"] == ""
+    assert staged["tags"] == ""
+    assert staged["aliases"] == "=x\x1fy"
+    assert staged["canonical"] == "true"
+
+
+def test_commit_batches_retries_only_transient_codes(neo4j_server: str) -> None:
+    from irrev.commands.neo4j_cmd import _commit_batches
+    from irrev.neo4j.http import Neo4jError
+
+    cfg = Neo4jHttpConfig(http_uri=neo4j_server, user="neo4j", password="pw", database="irrev")
+    statements = [{"statement": "RETURN 1"}]
+    deadlock = {"code": "Neo.TransientError.Transaction.DeadlockDetected", "message": "deadlock"}
+    _TxHandler.errors = [deadlock, deadlock]
+    with Neo4jHttpClient(cfg) as client:
+        _commit_batches(client, cfg, statements, concurrency=1)
+    assert len(_TxHandler.bodies) == 3
+
+    _TxHandler.bodies = []
+    _TxHandler.errors = [{"code": "Neo.ClientError.Statement.SyntaxError", "message": "near TransientError"}]
+    with Neo4jHttpClient(cfg) as client, pytest.raises(Neo4jError) as excinfo:
+        _commit_batches(client, cfg, statements, concurrency=1)
+    assert excinfo.value.code == "Neo.ClientError.Statement.SyntaxError"
+    assert len(_TxHandler.bodies) == 1